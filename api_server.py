@@ -3,31 +3,66 @@ Ad Intelligence Agent - HTTP API Server
 Provides REST API endpoints for the ad intelligence pipeline
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict, Any
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, ConfigDict, ValidationError
+from typing import List, Optional, Dict, Any, Annotated
 from datetime import datetime, timezone
 import uvicorn
 import structlog
 import json
 import os
+import asyncio
+import hashlib
+import time
+import uuid
+import orjson
+import msgspec
+import httpx
+from functools import lru_cache, partial
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from src.collection.collectors.meta_ad_library import MetaAdLibraryCollector
 from src.collection.collectors.mock_collector import MockAdCollector
 from src.collection.collectors.meta_web_scraper import MetaWebScraper
-from src.collection.collectors.base_collector import CollectionConfig
+from src.collection.collectors.base_collector import BaseCollector, CollectionConfig
 from src.preprocessing.pipeline import PreprocessingPipeline
 from src.classification.pipeline import ClassificationPipeline
 from src.analysis.performance_analyzer import PerformanceAnalyzer
 from src.analysis.report_generator import ReportGenerator
+from src.pipeline import StreamingPipeline
+
+try:
+    import uvloop  # noqa: F401
+    UVLOOP_AVAILABLE = True
+except ImportError:  # Not available on Windows
+    UVLOOP_AVAILABLE = False
+
+try:
+    import httptools  # noqa: F401
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib encoder"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Ad Intelligence Agent API",
     description="AI Agent for competitor ad intelligence and analysis",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
 logger = structlog.get_logger()
@@ -59,6 +94,7 @@ class AdCollectionRequest(BaseModel):
     max_results: int = Field(default=10, description="Maximum number of ads to collect", ge=1, le=100)
     
     model_config = ConfigDict(
+        extra="ignore",
         json_schema_extra={
             "example": {
                 "keywords": ["Nike", "Adidas"],
@@ -82,6 +118,32 @@ class AdData(BaseModel):
     classification_results: Optional[Dict[str, Any]] = None
 
 
+class AnalyzedAd(BaseModel):
+    """Compact per-ad result; ?verbose=1 adds the remaining ad fields"""
+    ad_id: Optional[str] = None
+    platform: Optional[str] = None
+    brand_name: Optional[str] = None
+    performance_score: float
+    roi: float
+    
+    model_config = ConfigDict(extra="allow")
+
+
+class AnalysisSection(BaseModel):
+    """Batch-level analysis results"""
+    summary: Dict[str, Any]
+    insights: Dict[str, Any]
+    high_performers: List[Dict[str, Any]]
+    low_performers: List[Dict[str, Any]]
+
+
+class ReportPaths(BaseModel):
+    """Report files written after the response is sent"""
+    json_report: str = Field(..., alias="json")
+    csv: Optional[str] = None
+    visual: Optional[str] = None
+
+
 class AdCollectionResponse(BaseModel):
     """Response model for ad collection"""
     success: bool
@@ -89,9 +151,11 @@ class AdCollectionResponse(BaseModel):
     total_collected: int
     total_preprocessed: int
     total_classified: int
-    ads: List[Dict[str, Any]]
+    ads: List[AnalyzedAd]
     execution_time_seconds: float
     timestamp: str
+    analysis: Optional[AnalysisSection] = None
+    reports: Optional[ReportPaths] = None
     
     model_config = ConfigDict(
         json_schema_extra={
@@ -122,15 +186,193 @@ class HealthCheckResponse(BaseModel):
 class RegistrationRequest(BaseModel):
     """Request to register with supervisor"""
     supervisor_url: str = Field(..., description="URL of the supervisor service")
+    
+    model_config = ConfigDict(extra="ignore")
+
+
+class CollectRequestBody(msgspec.Struct):
+    """
+    Decoder for AdCollectionRequest bodies on the collect endpoints
+    Same fields and limits; AdCollectionRequest still provides the OpenAPI schema
+    """
+    keywords: Annotated[List[str], msgspec.Meta(min_length=1)]
+    platform: str = "metaweb"
+    max_results: Annotated[int, msgspec.Meta(ge=1, le=100)] = 10
+
+
+COLLECT_REQUEST_DECODER = msgspec.json.Decoder(CollectRequestBody)
+
+COLLECT_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": AdCollectionRequest.model_json_schema()}}
+    }
+}
+
+
+async def decode_collect_request(http_request: Request) -> CollectRequestBody:
+    """
+    Validate a collect request body with msgspec instead of pydantic
+    Bodies msgspec rejects are validated again by AdCollectionRequest, so errors
+    keep FastAPI's 422 [{type, loc, msg}] shape and anything pydantic coerces
+    (e.g. "max_results": "5") is still accepted
+    """
+    body = await http_request.body()
+    try:
+        return COLLECT_REQUEST_DECODER.decode(body)
+    except msgspec.DecodeError:
+        pass
+    
+    # Same steps and error entries as FastAPI's own body handling
+    if not body:
+        raise RequestValidationError(
+            [{'type': 'missing', 'loc': ('body',), 'msg': 'Field required', 'input': None}]
+        )
+    try:
+        data = json.loads(body)
+    except json.JSONDecodeError as e:
+        raise RequestValidationError(
+            [{'type': 'json_invalid', 'loc': ('body', e.pos), 'msg': 'JSON decode error',
+              'input': {}, 'ctx': {'error': e.msg}}],
+            body=e.doc
+        )
+    try:
+        request = AdCollectionRequest.model_validate(data, from_attributes=True)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, 'loc': ('body', *error['loc'])} for error in e.errors(include_url=False)],
+            body=data
+        )
+    return CollectRequestBody(**request.model_dump())
 
 
 # ============================================================================
 # GLOBAL STATE
 # ============================================================================
 
-start_time = datetime.now(timezone.utc)
+start_monotonic = time.monotonic()
 supervisor_url: Optional[str] = None
 
+# Pipeline components, created once at startup and shared across requests
+PREPROCESSING: Optional[PreprocessingPipeline] = None
+CLASSIFICATION: Optional[ClassificationPipeline] = None
+ANALYZER: Optional[PerformanceAnalyzer] = None
+REPORT_GEN: Optional[ReportGenerator] = None
+
+# Fields returned per ad unless the client asks for verbose output
+LITE_AD_FIELDS = ('ad_id', 'platform', 'brand_name', 'performance_score', 'roi')
+
+# Number of high/low performers included in the response
+TOP_PERFORMERS = 5
+
+# Pooled HTTP client for supervisor calls, opened at startup
+HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+# Recent /api/v1/collect responses, keyed by (platform, keywords, max_results, verbose).
+# A hit returns the cached ads, analysis and report paths with fresh timing fields
+RESPONSE_CACHE: TTLCache = TTLCache(maxsize=256, ttl=300)
+# Platforms whose responses are never cached: mock draws new random ads on every request
+UNCACHED_PLATFORMS = ('mock',)
+RESPONSE_CACHE_LOCK = asyncio.Lock()
+
+# Executor for the blocking pipeline stages so they never run on the event loop.
+# Opened at startup and shut down with the app, so each lifespan gets its own
+STAGE_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _response_cache_key(request: CollectRequestBody, verbose: bool) -> str:
+    """Build a cache key that ignores keyword order"""
+    payload = json.dumps({
+        "p": request.platform,
+        "k": sorted(request.keywords),
+        "n": request.max_results,
+        "v": verbose
+    })
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _shared_collector(platform: str, keywords: tuple, max_results: int) -> Optional[BaseCollector]:
+    """Collectors that hold no per-run state, reused across identical requests"""
+    config = CollectionConfig(
+        platform=platform,
+        keywords=list(keywords),
+        max_results=max_results,
+        rate_limit_per_second=0.5
+    )
+    if platform == 'meta':
+        return MetaAdLibraryCollector(config)
+    if platform == 'mock':
+        return MockAdCollector(config)
+    return None
+
+
+def get_collector(platform: str, keywords: tuple, max_results: int) -> Optional[BaseCollector]:
+    """
+    Collector for a request, or None if the platform is not implemented
+    MetaWebScraper owns a WebDriver for the duration of a run, so it is never shared
+    """
+    if platform == 'metaweb':
+        return MetaWebScraper(CollectionConfig(
+            platform=platform,
+            keywords=list(keywords),
+            max_results=max_results,
+            rate_limit_per_second=0.5
+        ))
+    return _shared_collector(platform, keywords, max_results)
+
+
+@lru_cache(maxsize=2)
+def _iso_timestamp(second: int) -> str:
+    """UTC ISO-8601 timestamp for a Unix second, formatted once per second"""
+    return datetime.fromtimestamp(second, timezone.utc).isoformat()
+
+
+def utc_timestamp() -> str:
+    """Current UTC timestamp at one-second resolution"""
+    return _iso_timestamp(int(time.time()))
+
+
+# Pre-serialized bodies for the endpoints polled by supervisors/registries
+ROOT_RESPONSE_BYTES = orjson.dumps({
+    "message": "Ad Intelligence Agent API",
+    "version": AGENT_INFO["version"],
+    "status": "running",
+    "endpoints": {
+        "health": "/health",
+        "collect": "/api/v1/collect",
+        "collect_stream": "/api/v1/collect/stream",
+        "register": "/api/v1/register",
+        "docs": "/docs"
+    }
+})
+AGENT_INFO_BYTES = orjson.dumps(AGENT_INFO)
+
+
+@lru_cache(maxsize=2)
+def _health_body(second: int) -> bytes:
+    """Health payload, rebuilt at most once per second"""
+    return orjson.dumps({
+        "status": "healthy",
+        "agent_id": AGENT_INFO["agent_id"],
+        "version": AGENT_INFO["version"],
+        "timestamp": utc_timestamp(),
+        "uptime_seconds": time.monotonic() - start_monotonic,
+        "capabilities": AGENT_INFO["capabilities"]
+    })
+
+
+@lru_cache(maxsize=4)
+def _status_body(second: int, registered_url: Optional[str]) -> bytes:
+    """Status payload, rebuilt at most once per second or on registration change"""
+    dynamic = orjson.dumps({
+        "uptime_seconds": time.monotonic() - start_monotonic,
+        "supervisor_url": registered_url,
+        "registered": registered_url is not None,
+        "timestamp": utc_timestamp()
+    })
+    return b'{"agent_info":' + AGENT_INFO_BYTES + b',' + dynamic[1:]
+
 
 # ============================================================================
 # API ENDPOINTS
@@ -139,36 +381,29 @@ supervisor_url: Optional[str] = None
 @app.get("/", response_model=Dict[str, Any])
 async def root():
     """Root endpoint - returns agent information"""
-    return {
-        "message": "Ad Intelligence Agent API",
-        "version": AGENT_INFO["version"],
-        "status": "running",
-        "endpoints": {
-            "health": "/health",
-            "collect": "/api/v1/collect",
-            "register": "/api/v1/register",
-            "docs": "/docs"
-        }
-    }
+    return Response(content=ROOT_RESPONSE_BYTES, media_type="application/json")
 
 
 @app.get("/health", response_model=HealthCheckResponse)
 async def health_check():
     """Health check endpoint"""
-    uptime = (datetime.now(timezone.utc) - start_time).total_seconds()
-    
-    return HealthCheckResponse(
-        status="healthy",
-        agent_id=AGENT_INFO["agent_id"],
-        version=AGENT_INFO["version"],
-        timestamp=datetime.now(timezone.utc).isoformat(),
-        uptime_seconds=uptime,
-        capabilities=AGENT_INFO["capabilities"]
+    return Response(
+        content=_health_body(int(time.monotonic())),
+        media_type="application/json"
     )
 
 
-@app.post("/api/v1/collect", response_model=AdCollectionResponse)
-async def collect_ads(request: AdCollectionRequest):
+@app.post(
+    "/api/v1/collect",
+    response_model=None,  # Response is built as a plain dict; skip re-validation
+    responses={200: {"model": AdCollectionResponse}},
+    openapi_extra=COLLECT_REQUEST_OPENAPI
+)
+async def collect_ads(
+    http_request: Request,
+    background: BackgroundTasks,
+    verbose: bool = False
+):
     """
     Main endpoint to collect and process ads
     
@@ -177,9 +412,16 @@ async def collect_ads(request: AdCollectionRequest):
     2. Preprocesses the ads
     3. Classifies the ads
     4. Analyzes performance and generates insights
-    5. Returns structured results with reports
+    5. Returns structured results with report paths; the reports are
+       written in a background task after the response is sent
+    
+    Each ad is returned as a compact projection unless ?verbose=1 is passed.
+    Identical requests within 5 minutes (keywords in any order) are served from
+    cache: same ads, analysis and report paths, with fresh execution time and
+    timestamp. Mock requests are never cached
     """
-    start = datetime.now(timezone.utc)
+    start = time.monotonic()
+    request = await decode_collect_request(http_request)
     
     try:
         logger.info("Received ad collection request", 
@@ -194,90 +436,191 @@ async def collect_ads(request: AdCollectionRequest):
                 detail=f"Unsupported platform: {request.platform}. Supported: {AGENT_INFO['supported_platforms']}"
             )
         
+        # Serve identical recent requests from cache
+        cacheable = request.platform not in UNCACHED_PLATFORMS
+        cache_key = _response_cache_key(request, verbose)
+        if cacheable:
+            async with RESPONSE_CACHE_LOCK:
+                cached = RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                logger.info("Serving cached response", cache_key=cache_key)
+                return FastJSONResponse({
+                    **cached,
+                    'execution_time_seconds': time.monotonic() - start,
+                    'timestamp': utc_timestamp()
+                })
+        
         # 1. Data Collection
-        config = CollectionConfig(
-            platform=request.platform,
-            keywords=request.keywords,
-            max_results=request.max_results,
-            rate_limit_per_second=0.5
+        collector = get_collector(
+            request.platform,
+            tuple(sorted(request.keywords)),
+            request.max_results
         )
-        
-        if request.platform == 'meta':
-            collector = MetaAdLibraryCollector(config)
-        elif request.platform == 'metaweb':
-            collector = MetaWebScraper(config)
-        elif request.platform == 'mock':
-            collector = MockAdCollector(config)
-        else:
+        if collector is None:
             raise HTTPException(status_code=400, detail=f"Platform {request.platform} not implemented")
         
-        raw_ads = collector.run()
-        logger.info(f"Collected {len(raw_ads)} ads")
+        loop = asyncio.get_running_loop()
         
-        # 2. Preprocessing
-        preprocessing = PreprocessingPipeline()
-        preprocessed_ads = preprocessing.preprocess_batch(raw_ads, max_workers=4)
+        # 2-3. Preprocessing and classification, streamed as ads are collected
+        pipeline = StreamingPipeline(PREPROCESSING, CLASSIFICATION)
+        raw_ads, preprocessed_ads, classified_ads = await loop.run_in_executor(
+            STAGE_EXECUTOR, pipeline.run, collector
+        )
+        logger.info(f"Collected {len(raw_ads)} ads")
         logger.info(f"Preprocessed {len(preprocessed_ads)} ads")
-        
-        # 3. Classification
-        classification = ClassificationPipeline()
-        classified_ads = classification.classify_batch(preprocessed_ads, max_workers=4)
         logger.info(f"Classified {len(classified_ads)} ads")
         
         # 4. Performance Analysis
-        analyzer = PerformanceAnalyzer()
-        analysis_results = analyzer.analyze_batch(classified_ads)
+        analysis_results = await loop.run_in_executor(
+            STAGE_EXECUTOR,
+            partial(ANALYZER.analyze_batch, classified_ads, top_k=TOP_PERFORMERS)
+        )
         logger.info("Performance analysis complete")
         
-        # 5. Generate Reports
-        report_gen = ReportGenerator()
-        report_paths = report_gen.generate_all_reports(analysis_results)
-        logger.info(f"Generated reports: {list(report_paths.keys())}")
+        # 5. Generate Reports after the response is sent; only the paths are returned now
+        report_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        report_paths = REPORT_GEN.report_paths(report_id, analysis_results)
+        background.add_task(REPORT_GEN.generate_all_reports, analysis_results, report_paths)
+        logger.info(f"Scheduled reports: {list(report_paths.keys())}")
         
         # Calculate execution time
-        execution_time = (datetime.now(timezone.utc) - start).total_seconds()
+        execution_time = time.monotonic() - start
         
-        # Build response with analysis results
-        response = AdCollectionResponse(
-            success=True,
-            message=f"Successfully collected and processed {len(classified_ads)} ads",
-            total_collected=len(raw_ads),
-            total_preprocessed=len(preprocessed_ads),
-            total_classified=len(classified_ads),
-            ads=analysis_results['analyzed_ads'],
-            execution_time_seconds=execution_time,
-            timestamp=datetime.now(timezone.utc).isoformat()
-        )
+        analyzed_ads = analysis_results['analyzed_ads']
+        if not verbose:
+            analyzed_ads = [
+                {field: ad.get(field) for field in LITE_AD_FIELDS}
+                for ad in analyzed_ads
+            ]
         
-        # Add analysis results to response
-        response_dict = response.dict()
-        response_dict['analysis'] = {
-            'summary': analysis_results['summary'],
-            'insights': analysis_results['insights'],
-            'high_performers': analysis_results['high_performers'][:5],  # Top 5
-            'low_performers': analysis_results['low_performers'][:5],    # Bottom 5
+        # Build response with analysis results
+        response_dict = {
+            'success': True,
+            'message': f"Successfully collected and processed {len(classified_ads)} ads",
+            'total_collected': len(raw_ads),
+            'total_preprocessed': len(preprocessed_ads),
+            'total_classified': len(classified_ads),
+            'ads': analyzed_ads,
+            'execution_time_seconds': execution_time,
+            'timestamp': utc_timestamp(),
+            'analysis': {
+                'summary': analysis_results['summary'],
+                'insights': analysis_results['insights'],
+                'high_performers': analysis_results['high_performers'],
+                'low_performers': analysis_results['low_performers'],
+            },
+            'reports': report_paths
         }
-        response_dict['reports'] = report_paths
+        
+        # Ads are passed by reference and serialized exactly once per response
+        response = FastJSONResponse(response_dict, background=background)
+        if cacheable:
+            async with RESPONSE_CACHE_LOCK:
+                RESPONSE_CACHE[cache_key] = response_dict
         
         logger.info("Request completed successfully", 
                    total_ads=len(classified_ads),
                    execution_time=execution_time)
         
-        return JSONResponse(content=response_dict)
+        return response
         
     except Exception as e:
         logger.error("Error processing request", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/v1/collect/stream", openapi_extra=COLLECT_REQUEST_OPENAPI)
+async def collect_ads_stream(http_request: Request, background: BackgroundTasks):
+    """
+    Streaming variant of /api/v1/collect, returned as NDJSON
+    
+    Emits one line per ad as it is collected and as it is classified, then an
+    "analysis" line with scores and insights and a final "done" line with
+    totals and report paths
+    """
+    start = time.monotonic()
+    request = await decode_collect_request(http_request)
+    
+    logger.info("Received streaming ad collection request",
+               keywords=request.keywords,
+               platform=request.platform,
+               max_results=request.max_results)
+    
+    if request.platform not in AGENT_INFO["supported_platforms"]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported platform: {request.platform}. Supported: {AGENT_INFO['supported_platforms']}"
+        )
+    
+    collector = get_collector(
+        request.platform,
+        tuple(sorted(request.keywords)),
+        request.max_results
+    )
+    if collector is None:
+        raise HTTPException(status_code=400, detail=f"Platform {request.platform} not implemented")
+    
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    
+    def on_event(stage: str, ad: Dict):
+        loop.call_soon_threadsafe(events.put_nowait, (stage, ad))
+    
+    async def ndjson():
+        pipeline = StreamingPipeline(PREPROCESSING, CLASSIFICATION)
+        run = loop.run_in_executor(STAGE_EXECUTOR, pipeline.run, collector, on_event)
+        run.add_done_callback(lambda _: events.put_nowait(None))
+        
+        while (event := await events.get()) is not None:
+            stage, ad = event
+            yield orjson.dumps({"stage": stage, "ad": ad}, option=orjson.OPT_APPEND_NEWLINE)
+        
+        try:
+            raw_ads, preprocessed_ads, classified_ads = run.result()
+        except Exception as e:
+            logger.error("Error processing streaming request", error=str(e))
+            yield orjson.dumps({"stage": "error", "detail": str(e)}, option=orjson.OPT_APPEND_NEWLINE)
+            return
+        
+        analysis_results = await loop.run_in_executor(
+            STAGE_EXECUTOR,
+            partial(ANALYZER.analyze_batch, classified_ads, top_k=TOP_PERFORMERS)
+        )
+        yield orjson.dumps({
+            "stage": "analysis",
+            "ads": [
+                {field: ad.get(field) for field in LITE_AD_FIELDS}
+                for ad in analysis_results['analyzed_ads']
+            ],
+            "summary": analysis_results['summary'],
+            "insights": analysis_results['insights'],
+            "high_performers": analysis_results['high_performers'],
+            "low_performers": analysis_results['low_performers'],
+        }, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        
+        report_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        report_paths = REPORT_GEN.report_paths(report_id, analysis_results)
+        background.add_task(REPORT_GEN.generate_all_reports, analysis_results, report_paths)
+        
+        yield orjson.dumps({
+            "stage": "done",
+            "total_collected": len(raw_ads),
+            "total_preprocessed": len(preprocessed_ads),
+            "total_classified": len(classified_ads),
+            "execution_time_seconds": time.monotonic() - start,
+            "timestamp": utc_timestamp(),
+            "reports": report_paths,
+        }, option=orjson.OPT_APPEND_NEWLINE)
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson", background=background)
+
+
 @app.post("/api/v1/register")
 async def register_with_supervisor(request: RegistrationRequest):
     """Register this agent with a supervisor/registry service"""
     global supervisor_url
     
     try:
-        import requests
-        
         # Store supervisor URL
         supervisor_url = request.supervisor_url
         
@@ -289,13 +632,12 @@ async def register_with_supervisor(request: RegistrationRequest):
             "capabilities": AGENT_INFO["capabilities"],
             "health_check_url": "http://localhost:8000/health",
             "api_url": "http://localhost:8000/api/v1/collect",
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": utc_timestamp()
         }
         
-        response = requests.post(
+        response = await HTTP_CLIENT.post(
             f"{supervisor_url}/register",
-            json=registration_data,
-            timeout=10
+            json=registration_data
         )
         
         if response.status_code == 200:
@@ -314,7 +656,7 @@ async def register_with_supervisor(request: RegistrationRequest):
                 detail=f"Supervisor returned status {response.status_code}"
             )
             
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error("Failed to connect to supervisor", error=str(e))
         raise HTTPException(
             status_code=500,
@@ -325,15 +667,10 @@ async def register_with_supervisor(request: RegistrationRequest):
 @app.get("/api/v1/status")
 async def get_status():
     """Get detailed agent status"""
-    uptime = (datetime.now(timezone.utc) - start_time).total_seconds()
-    
-    return {
-        "agent_info": AGENT_INFO,
-        "uptime_seconds": uptime,
-        "supervisor_url": supervisor_url,
-        "registered": supervisor_url is not None,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
+    return Response(
+        content=_status_body(int(time.monotonic()), supervisor_url),
+        media_type="application/json"
+    )
 
 
 # ============================================================================
@@ -345,12 +682,29 @@ from contextlib import asynccontextmanager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler"""
+    global PREPROCESSING, CLASSIFICATION, ANALYZER, REPORT_GEN, HTTP_CLIENT, STAGE_EXECUTOR
+    
     # Startup
     logger.info("Ad Intelligence Agent API starting up", 
                version=AGENT_INFO["version"],
                agent_id=AGENT_INFO["agent_id"])
+    
+    # Load pipeline components once so per-request work is only the ads themselves
+    PREPROCESSING = PreprocessingPipeline()
+    CLASSIFICATION = ClassificationPipeline()
+    ANALYZER = PerformanceAnalyzer()
+    REPORT_GEN = ReportGenerator()
+    STAGE_EXECUTOR = ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 4,
+        thread_name_prefix="pipeline-stage"
+    )
+    await asyncio.get_running_loop().run_in_executor(STAGE_EXECUTOR, REPORT_GEN.warmup)
+    HTTP_CLIENT = httpx.AsyncClient(timeout=10.0)
+    
     yield
     # Shutdown
+    await HTTP_CLIENT.aclose()
+    STAGE_EXECUTOR.shutdown(wait=False)
     logger.info("Ad Intelligence Agent API shutting down")
 
 # Update app initialization to use lifespan
@@ -363,10 +717,15 @@ app.router.lifespan_context = lifespan
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
+    workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
     uvicorn.run(
         "api_server:app",
         host="0.0.0.0",
         port=port,
+        workers=workers,  # One process per core so CPU-bound requests don't queue
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        http="httptools" if HTTPTOOLS_AVAILABLE else "h11",
         reload=False,  # Disable reload in production
-        log_level="info"
+        log_level="warning",
+        access_log=False
     )
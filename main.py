@@ -1,6 +1,7 @@
 """Main application entry point"""
 
 import argparse
+import orjson
 import structlog
 from pathlib import Path
 from src.collection.collectors.meta_ad_library import MetaAdLibraryCollector
@@ -11,6 +12,7 @@ from src.collection.collectors.meta_web_scraper import MetaWebScraper
 from src.collection.collectors.base_collector import CollectionConfig
 from src.preprocessing.pipeline import PreprocessingPipeline
 from src.classification.pipeline import ClassificationPipeline
+from src.pipeline import StreamingPipeline
 
 logger = structlog.get_logger()
 
@@ -37,6 +39,17 @@ def main():
         default=100,
         help='Maximum number of ads to collect'
     )
+    parser.add_argument(
+        '--simulate-delay',
+        action='store_true',
+        help='Sleep between mock ads like a real scraper (mock platform only)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed for reproducible mock data (mock platform only)'
+    )
     parser.add_argument(
         '--output',
         type=str,
@@ -57,7 +70,9 @@ def main():
         platform=args.platform,
         keywords=args.keywords,
         max_results=args.max_results,
-        rate_limit_per_second=0.5
+        rate_limit_per_second=0.5,
+        simulate_delay=args.simulate_delay,
+        seed=args.seed
     )
     
     if args.platform == 'meta':
@@ -74,28 +89,20 @@ def main():
         logger.error("Platform not yet implemented", platform=args.platform)
         return
     
-    raw_ads = collector.run()
+    # 2-3. Preprocessing and classification, streamed as ads are collected
+    logger.info("STEP 2-3: Preprocessing, Normalization & Classification (streamed)")
+    pipeline = StreamingPipeline(PreprocessingPipeline(), ClassificationPipeline())
+    raw_ads, preprocessed_ads, classified_ads = pipeline.run(collector)
     logger.info(f"Collected {len(raw_ads)} ads")
-    
-    # 2. Preprocessing
-    logger.info("STEP 2: Preprocessing & Normalization")
-    preprocessing = PreprocessingPipeline()
-    preprocessed_ads = preprocessing.preprocess_batch(raw_ads, max_workers=4)
     logger.info(f"Preprocessed {len(preprocessed_ads)} ads")
-    
-    # 3. Classification
-    logger.info("STEP 3: Classification & Tagging")
-    classification = ClassificationPipeline()
-    classified_ads = classification.classify_batch(preprocessed_ads, max_workers=4)
     logger.info(f"Classified {len(classified_ads)} ads")
     
     # 4. Save results
-    import json
     output_path = Path(args.output)
     output_path.parent.mkdir(exist_ok=True, parents=True)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(classified_ads, f, indent=2, ensure_ascii=False)
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(classified_ads, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY))
     
     logger.info("Pipeline complete", output=str(output_path.absolute()))
 
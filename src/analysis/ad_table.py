@@ -0,0 +1,64 @@
+"""Columnar (structure-of-arrays) view of a batch of ads"""
+
+from dataclasses import dataclass
+from typing import List, Dict, Any
+import numpy as np
+
+
+def to_number(value: Any) -> float:
+    """Numeric field value, with missing or non-numeric values (numeric strings too) as 0"""
+    return value if isinstance(value, (int, float)) else 0
+
+
+@dataclass
+class AdTable:
+    """
+    Parallel NumPy columns holding the numeric fields of a batch of ads
+    Row i of every column belongs to ads[i] of the batch it was built from
+    """
+    impressions: np.ndarray
+    spend_lower: np.ndarray
+    spend_upper: np.ndarray
+    has_headline: np.ndarray
+    has_body: np.ndarray
+    has_cta: np.ndarray
+    has_media: np.ndarray
+
+    @classmethod
+    def from_ads(cls, ads: List[Dict[str, Any]]) -> 'AdTable':
+        """Extract the columns in one pass per field"""
+        count = len(ads)
+        # Anything but a dict counts as no spend, as in calculate_roi
+        spend_ranges = [
+            spend if isinstance(spend := ad.get('spend_range'), dict) else {}
+            for ad in ads
+        ]
+
+        def numeric(values) -> np.ndarray:
+            return np.fromiter(values, dtype=np.float64, count=count)
+
+        def flag(field: str) -> np.ndarray:
+            return np.fromiter((bool(ad.get(field)) for ad in ads), dtype=bool, count=count)
+
+        return cls(
+            impressions=numeric(to_number(ad.get('impressions')) for ad in ads),
+            spend_lower=numeric(to_number(spend.get('lower')) for spend in spend_ranges),
+            spend_upper=numeric(to_number(spend.get('upper')) for spend in spend_ranges),
+            has_headline=flag('headline'),
+            has_body=flag('body_text'),
+            has_cta=flag('call_to_action'),
+            has_media=flag('media_urls'),
+        )
+
+    def __len__(self) -> int:
+        return len(self.impressions)
+
+    @property
+    def content_score(self) -> np.ndarray:
+        """Content quality points: headline 10, body 10, CTA 5, media 5"""
+        return (
+            10.0 * self.has_headline +
+            10.0 * self.has_body +
+            5.0 * self.has_cta +
+            5.0 * self.has_media
+        )
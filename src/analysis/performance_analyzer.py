@@ -3,9 +3,12 @@ Performance Analysis Module
 Calculates ROI, performance scores, and identifies high/low performers
 """
 
-from typing import List, Dict, Any
-import statistics
+from typing import List, Dict, Any, Optional
+from collections import defaultdict
 from datetime import datetime
+import numpy as np
+from src.analysis._kernels import score_columns
+from src.analysis.ad_table import AdTable, to_number
 
 
 class PerformanceAnalyzer:
@@ -22,48 +25,43 @@ class PerformanceAnalyzer:
         """
         Calculate ROI for an ad
         ROI = (Impressions / Spend) * 100
+        Missing or non-numeric values count as 0, coerced by to_number as in AdTable
         """
-        try:
-            impressions = ad.get('impressions', 0)
-            spend_range = ad.get('spend_range', {})
-            
-            if not impressions or not spend_range:
-                return 0.0
-            
-            # Use average of spend range
-            lower = spend_range.get('lower', 0)
-            upper = spend_range.get('upper', 0)
-            
-            if lower == 0 and upper == 0:
-                return 0.0
-            
-            avg_spend = (lower + upper) / 2 if upper > 0 else lower
-            
-            if avg_spend == 0:
-                return 0.0
-            
-            roi = (impressions / avg_spend) * 100
-            return round(roi, 2)
-            
-        except Exception:
+        impressions = to_number(ad.get('impressions'))
+        spend_range = ad.get('spend_range')
+        
+        if not impressions or not isinstance(spend_range, dict):
             return 0.0
+        
+        # Use average of spend range
+        lower = to_number(spend_range.get('lower'))
+        upper = to_number(spend_range.get('upper'))
+        avg_spend = (lower + upper) / 2 if upper > 0 else lower
+        
+        if avg_spend == 0:
+            return 0.0
+        
+        roi = (impressions / avg_spend) * 100
+        return round(roi, 2)
     
-    def calculate_performance_score(self, ad: Dict[str, Any]) -> float:
+    def calculate_performance_score(self, ad: Dict[str, Any], roi: Optional[float] = None) -> float:
         """
         Calculate overall performance score (0-100)
         Based on: ROI, impressions, engagement signals
+        Pass roi if it is already known to skip recomputing it
         """
         score = 0.0
         
         # ROI component (40%)
-        roi = self.calculate_roi(ad)
+        if roi is None:
+            roi = self.calculate_roi(ad)
         if roi > 0:
             # Normalize ROI (cap at 1000 for scoring)
             roi_score = min(roi / 1000, 1.0) * 40
             score += roi_score
         
         # Impressions component (30%)
-        impressions = ad.get('impressions', 0)
+        impressions = to_number(ad.get('impressions'))
         if impressions > 0:
             # Normalize impressions (cap at 100k for scoring)
             imp_score = min(impressions / 100000, 1.0) * 30
@@ -86,9 +84,19 @@ class PerformanceAnalyzer:
         
         return round(min(score, 100), 2)
     
-    def analyze_batch(self, ads: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def analyze_batch(
+        self,
+        ads: List[Dict[str, Any]],
+        top_k: Optional[int] = None,
+        sort_results: bool = True
+    ) -> Dict[str, Any]:
         """
         Analyze a batch of ads and generate insights
+        Ads are annotated in place with roi, performance_score and analyzed_at
+        If top_k is given, only the first top_k high/low performers are returned
+        (summary counts still cover all of them)
+        With sort_results=False, analyzed_ads keeps the input order and only the
+        performer lists are sorted
         """
         if not ads:
             return {
@@ -98,49 +106,56 @@ class PerformanceAnalyzer:
                 "summary": {}
             }
         
-        # Calculate metrics for each ad
-        analyzed_ads = []
-        for ad in ads:
-            roi = self.calculate_roi(ad)
-            performance_score = self.calculate_performance_score(ad)
-            
-            analyzed_ad = {
-                **ad,
-                "roi": roi,
-                "performance_score": performance_score,
-                "analyzed_at": datetime.utcnow().isoformat()
-            }
-            analyzed_ads.append(analyzed_ad)
+        # Calculate metrics for all ads at once over columnar arrays
+        table = AdTable.from_ads(ads)
+        rois, scores = score_columns(
+            table.impressions, table.spend_lower, table.spend_upper, table.content_score
+        )
+        
+        # Order, statistics and performer thresholds stay in NumPy; dicts are
+        # only annotated once the numeric work is done
+        positive_rois = rois[rois > 0]
+        avg_score = float(scores.mean())
+        median_score = float(np.median(scores))
+        avg_roi = float(positive_rois.mean()) if positive_rois.size else 0
         
-        # Sort by performance score
-        analyzed_ads.sort(key=lambda x: x['performance_score'], reverse=True)
+        # Best is the first maximum and worst the last minimum, as in a stable
+        # descending sort
+        top_index = int(np.argmax(scores))
+        worst_index = len(ads) - 1 - int(np.argmin(scores[::-1]))
         
-        # Calculate statistics
-        scores = [ad['performance_score'] for ad in analyzed_ads]
-        rois = [ad['roi'] for ad in analyzed_ads if ad['roi'] > 0]
+        high_index = _sorted_by_score(np.flatnonzero(scores >= avg_score * 1.5), scores)
+        low_index = _sorted_by_score(np.flatnonzero(scores <= avg_score * 0.5), scores)
         
-        avg_score = statistics.mean(scores) if scores else 0
-        median_score = statistics.median(scores) if scores else 0
-        avg_roi = statistics.mean(rois) if rois else 0
+        analyzed_at = datetime.utcnow().isoformat()
+        for ad, roi, performance_score in zip(ads, rois.tolist(), scores.tolist()):
+            ad["roi"] = roi
+            ad["performance_score"] = performance_score
+            ad["analyzed_at"] = analyzed_at
         
-        # Identify high and low performers
-        high_performers = [
-            ad for ad in analyzed_ads 
-            if ad['performance_score'] >= avg_score * 1.5
-        ]
+        if sort_results:
+            order = np.argsort(-scores, kind='stable')
+            analyzed_ads = [ads[i] for i in order.tolist()]
+        else:
+            order = np.arange(len(ads))
+            analyzed_ads = ads
         
-        low_performers = [
-            ad for ad in analyzed_ads 
-            if ad['performance_score'] <= avg_score * 0.5
-        ]
+        # Exceptional-ROI ads, listed in analyzed_ads order
+        if avg_roi > 0:
+            high_roi_index = order[rois[order] > avg_roi * 1.5]
+        else:
+            high_roi_index = order[:0]
+        
+        high_performers = [ads[i] for i in high_index.tolist()]
+        low_performers = [ads[i] for i in low_index.tolist()]
+        high_roi_ads = [ads[i]['ad_id'] for i in high_roi_index.tolist()]
         
         # Generate insights
         insights = self._generate_insights(
             analyzed_ads, 
             high_performers, 
             low_performers,
-            avg_score,
-            avg_roi
+            high_roi_ads
         )
         
         # Summary statistics
@@ -151,10 +166,14 @@ class PerformanceAnalyzer:
             "average_roi": round(avg_roi, 2),
             "high_performers_count": len(high_performers),
             "low_performers_count": len(low_performers),
-            "top_performing_ad": analyzed_ads[0]['ad_id'] if analyzed_ads else None,
-            "worst_performing_ad": analyzed_ads[-1]['ad_id'] if analyzed_ads else None
+            "top_performing_ad": ads[top_index]['ad_id'],
+            "worst_performing_ad": ads[worst_index]['ad_id']
         }
         
+        if top_k is not None:
+            high_performers = high_performers[:top_k]
+            low_performers = low_performers[:top_k]
+        
         return {
             "total_ads": len(analyzed_ads),
             "analyzed_ads": analyzed_ads,
@@ -162,7 +181,7 @@ class PerformanceAnalyzer:
             "low_performers": low_performers,
             "insights": insights,
             "summary": summary,
-            "analyzed_at": datetime.utcnow().isoformat()
+            "analyzed_at": analyzed_at
         }
     
     def _generate_insights(
@@ -170,8 +189,7 @@ class PerformanceAnalyzer:
         all_ads: List[Dict], 
         high_performers: List[Dict],
         low_performers: List[Dict],
-        avg_score: float,
-        avg_roi: float
+        high_roi_ads: List[str]
     ) -> Dict[str, Any]:
         """Generate actionable insights from the analysis"""
         
@@ -201,55 +219,54 @@ class PerformanceAnalyzer:
                 "recommendation": "Consider increasing budget for these campaigns"
             })
         
-        # Platform analysis
-        platform_performance = {}
+        # Platform and brand analysis in a single pass, keeping
+        # running (sum, count) per group instead of lists of scores
+        platform_performance = defaultdict(lambda: [0.0, 0])
+        brand_performance = defaultdict(lambda: [0.0, 0])
+        
         for ad in all_ads:
-            platform = ad.get('platform', 'unknown')
-            if platform not in platform_performance:
-                platform_performance[platform] = []
-            platform_performance[platform].append(ad['performance_score'])
+            score = ad['performance_score']
+            
+            platform = platform_performance[ad.get('platform', 'unknown')]
+            platform[0] += score
+            platform[1] += 1
+            
+            brand = brand_performance[ad.get('brand_name', 'Unknown')]
+            brand[0] += score
+            brand[1] += 1
         
-        best_platform = max(
-            platform_performance.items(),
-            key=lambda x: statistics.mean(x[1]) if x[1] else 0
-        )[0] if platform_performance else None
+        platform_means = {platform: total / count for platform, (total, count) in platform_performance.items()}
+        best_platform = max(platform_means, key=platform_means.get) if platform_means else None
         
         if best_platform:
             insights["trends"]["best_platform"] = {
                 "platform": best_platform,
-                "avg_score": round(statistics.mean(platform_performance[best_platform]), 2),
+                "avg_score": round(platform_means[best_platform], 2),
                 "recommendation": f"Focus more budget on {best_platform} platform"
             }
         
-        # Brand analysis
-        brand_performance = {}
-        for ad in all_ads:
-            brand = ad.get('brand_name', 'Unknown')
-            if brand not in brand_performance:
-                brand_performance[brand] = []
-            brand_performance[brand].append(ad['performance_score'])
-        
-        if brand_performance:
-            top_brand = max(
-                brand_performance.items(),
-                key=lambda x: statistics.mean(x[1]) if x[1] else 0
-            )
+        brand_means = {brand: total / count for brand, (total, count) in brand_performance.items()}
+        if brand_means:
+            top_brand = max(brand_means, key=brand_means.get)
             
             insights["trends"]["top_performing_brand"] = {
-                "brand": top_brand[0],
-                "avg_score": round(statistics.mean(top_brand[1]), 2),
-                "ad_count": len(top_brand[1])
+                "brand": top_brand,
+                "avg_score": round(brand_means[top_brand], 2),
+                "ad_count": brand_performance[top_brand][1]
             }
         
         # ROI insights
-        if avg_roi > 0:
-            high_roi_ads = [ad for ad in all_ads if ad['roi'] > avg_roi * 1.5]
-            if high_roi_ads:
-                insights["recommendations"].append({
-                    "type": "roi_optimization",
-                    "message": f"{len(high_roi_ads)} ads have exceptional ROI",
-                    "action": "Analyze these ads for successful patterns to replicate",
-                    "example_ads": [ad['ad_id'] for ad in high_roi_ads[:3]]
-                })
+        if high_roi_ads:
+            insights["recommendations"].append({
+                "type": "roi_optimization",
+                "message": f"{len(high_roi_ads)} ads have exceptional ROI",
+                "action": "Analyze these ads for successful patterns to replicate",
+                "example_ads": high_roi_ads[:3]
+            })
         
         return insights
+
+
+def _sorted_by_score(indices: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    """Order a subset of ad indices by descending score, keeping ties in input order"""
+    return indices[np.argsort(-scores[indices], kind='stable')]
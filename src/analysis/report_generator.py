@@ -3,23 +3,33 @@ Report Generator
 Creates JSON, CSV, and visual reports
 """
 
+import heapq
+import io
 import json
 import csv
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
+from collections import defaultdict
+import numpy as np
 import structlog
 
 logger = structlog.get_logger()
 
 try:
-    import matplotlib.pyplot as plt
     import matplotlib
     matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     import pandas as pd
     PANDAS_AVAILABLE = True
@@ -34,6 +44,21 @@ class ReportGenerator:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True, parents=True)
     
+    def warmup(self):
+        """
+        Load matplotlib's font cache and renderer once, so the first dashboard
+        of a request doesn't pay for it
+        """
+        if not MATPLOTLIB_AVAILABLE:
+            return
+        
+        fig, ax = plt.subplots(figsize=(1, 1))
+        ax.set_title('warmup', fontweight='bold')
+        ax.bar(['a'], [1])
+        fig.savefig(io.BytesIO(), format='png')
+        plt.close(fig)
+        logger.info("Report renderer warmed up")
+    
     def generate_json_report(
         self, 
         analysis_results: Dict[str, Any],
@@ -47,8 +72,15 @@ class ReportGenerator:
         
         filepath = self.output_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(analysis_results, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    analysis_results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(analysis_results, f, indent=2, ensure_ascii=False)
         
         return str(filepath.absolute())
     
@@ -79,25 +111,17 @@ class ReportGenerator:
             'collected_at'
         ]
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-            
-            for ad in ads:
-                spend_range = ad.get('spend_range', {})
-                row = {
-                    'ad_id': ad.get('ad_id', ''),
-                    'platform': ad.get('platform', ''),
-                    'brand_name': ad.get('brand_name', ''),
-                    'headline': ad.get('headline', '')[:100],  # Truncate
-                    'impressions': ad.get('impressions', 0),
-                    'spend_lower': spend_range.get('lower', 0) if spend_range else 0,
-                    'spend_upper': spend_range.get('upper', 0) if spend_range else 0,
-                    'roi': ad.get('roi', 0),
-                    'performance_score': ad.get('performance_score', 0),
-                    'collected_at': ad.get('collected_at', '')
-                }
-                writer.writerow(row)
+        # One pass over the ads, one tuple per row
+        rows = [_csv_row(ad) for ad in ads]
+        
+        if PANDAS_AVAILABLE:
+            df = pd.DataFrame(rows, columns=columns, dtype=object)
+            df.to_csv(filepath, index=False, encoding='utf-8', lineterminator='\r\n')
+        else:
+            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(rows)
         
         return str(filepath.absolute())
     
@@ -127,7 +151,7 @@ class ReportGenerator:
         fig.suptitle('Ad Performance Analysis Dashboard', fontsize=16, fontweight='bold')
         
         # 1. Performance Score Distribution
-        scores = [ad['performance_score'] for ad in ads]
+        scores = np.fromiter((ad['performance_score'] for ad in ads), dtype=np.float64, count=len(ads))
         axes[0, 0].hist(scores, bins=20, color='skyblue', edgecolor='black')
         axes[0, 0].set_title('Performance Score Distribution')
         axes[0, 0].set_xlabel('Performance Score')
@@ -141,7 +165,7 @@ class ReportGenerator:
         axes[0, 0].legend()
         
         # 2. Top 10 Performers
-        top_10 = sorted(ads, key=lambda x: x['performance_score'], reverse=True)[:10]
+        top_10 = heapq.nlargest(10, ads, key=lambda x: x['performance_score'])
         ad_labels = [f"{ad.get('brand_name', 'Unknown')[:15]}" for ad in top_10]
         scores_top = [ad['performance_score'] for ad in top_10]
         
@@ -150,17 +174,22 @@ class ReportGenerator:
         axes[0, 1].set_xlabel('Performance Score')
         axes[0, 1].invert_yaxis()
         
-        # 3. Platform Performance
-        platform_data = {}
+        # 3. Platform Performance, plus the ROI scatter points, in one pass
+        platform_data = defaultdict(lambda: [0.0, 0])
+        rois = []
+        impressions = []
         for ad in ads:
-            platform = ad.get('platform', 'unknown')
-            if platform not in platform_data:
-                platform_data[platform] = []
-            platform_data[platform].append(ad['performance_score'])
+            platform = platform_data[ad.get('platform', 'unknown')]
+            platform[0] += ad['performance_score']
+            platform[1] += 1
+            
+            roi = ad.get('roi', 0)
+            if roi > 0:
+                rois.append(roi)
+                impressions.append(ad.get('impressions', 0))
         
         platforms = list(platform_data.keys())
-        avg_scores = [sum(scores)/len(scores) if scores else 0 
-                     for scores in platform_data.values()]
+        avg_scores = [total / count for total, count in platform_data.values()]
         
         axes[1, 0].bar(platforms, avg_scores, color='orange')
         axes[1, 0].set_title('Average Performance by Platform')
@@ -169,9 +198,6 @@ class ReportGenerator:
         axes[1, 0].tick_params(axis='x', rotation=45)
         
         # 4. ROI vs Impressions Scatter
-        rois = [ad.get('roi', 0) for ad in ads if ad.get('roi', 0) > 0]
-        impressions = [ad.get('impressions', 0) for ad in ads if ad.get('roi', 0) > 0]
-        
         if rois and impressions:
             axes[1, 1].scatter(impressions, rois, alpha=0.6, color='purple')
             axes[1, 1].set_title('ROI vs Impressions')
@@ -183,43 +209,81 @@ class ReportGenerator:
                           ha='center', va='center', fontsize=12)
             axes[1, 1].set_title('ROI vs Impressions')
         
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(filepath, dpi=150, bbox_inches='tight')
+        plt.close(fig)
         
         return str(filepath.absolute())
     
-    def generate_all_reports(
+    def report_paths(
         self,
+        report_id: str,
         analysis_results: Dict[str, Any]
     ) -> Dict[str, str]:
-        """Generate all report types"""
+        """Paths generate_all_reports will write for these results"""
+        
+        paths = {'json': str((self.output_dir / f"report_{report_id}.json").absolute())}
+        
+        if analysis_results.get('analyzed_ads'):
+            paths['csv'] = str((self.output_dir / f"report_{report_id}.csv").absolute())
+            if MATPLOTLIB_AVAILABLE:
+                paths['visual'] = str((self.output_dir / f"report_{report_id}.png").absolute())
+        
+        return paths
+    
+    def generate_all_reports(
+        self,
+        analysis_results: Dict[str, Any],
+        paths: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """Generate all report types, optionally into precomputed paths"""
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if paths is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            paths = self.report_paths(timestamp, analysis_results)
         
         reports = {}
         
         # JSON report
-        json_path = self.generate_json_report(
+        reports['json'] = self.generate_json_report(
             analysis_results,
-            f"report_{timestamp}.json"
+            Path(paths['json']).name
         )
-        reports['json'] = json_path
         
         # CSV report
-        if analysis_results.get('analyzed_ads'):
-            csv_path = self.generate_csv_report(
+        if 'csv' in paths:
+            reports['csv'] = self.generate_csv_report(
                 analysis_results['analyzed_ads'],
-                f"report_{timestamp}.csv"
+                Path(paths['csv']).name
             )
-            reports['csv'] = csv_path
         
         # Visual summary
-        visual_path = self.generate_visual_summary(
-            analysis_results,
-            f"report_{timestamp}.png"
-        )
-        if visual_path:
-            reports['visual'] = visual_path
+        if 'visual' in paths:
+            visual_path = self.generate_visual_summary(
+                analysis_results,
+                Path(paths['visual']).name
+            )
+            if visual_path:
+                reports['visual'] = visual_path
+        
+        logger.info("Reports written", reports=list(reports.keys()))
         
         return reports
+
+
+def _csv_row(ad: Dict[str, Any]) -> tuple:
+    """CSV report row for one ad, in generate_csv_report column order"""
+    spend_range = ad.get('spend_range') or {}
+    headline = ad.get('headline', '')
+    return (
+        ad.get('ad_id', ''),
+        ad.get('platform', ''),
+        ad.get('brand_name', ''),
+        headline[:100] if headline else headline,  # Truncate
+        ad.get('impressions', 0),
+        spend_range.get('lower', 0),
+        spend_range.get('upper', 0),
+        ad.get('roi', 0),
+        ad.get('performance_score', 0),
+        ad.get('collected_at', '')
+    )
@@ -1,6 +1,6 @@
 """Ad format classifier"""
 
-from typing import Dict
+from typing import Dict, Sequence, Tuple
 from src.classification.models.model_cache import ModelCache
 
 
@@ -12,9 +12,7 @@ class AdFormatClassifier:
     
     def classify(self, ad_data: Dict) -> Dict:
         """Determine ad format"""
-        media = ad_data.get('content', {}).get('media', {})
-        images = media.get('images', [])
-        videos = media.get('videos', [])
+        images, videos = _media_of(ad_data)
         
         if videos:
             return {
@@ -67,3 +65,9 @@ class AdFormatClassifier:
             'alternatives': [],
             'reasoning': "Default classification"
         }
+
+
+def _media_of(ad_data: Dict) -> Tuple[Sequence, Sequence]:
+    """(images, videos) of an ad, without allocating empty containers"""
+    media = (ad_data.get('content') or {}).get('media') or {}
+    return media.get('images') or (), media.get('videos') or ()
@@ -7,7 +7,7 @@ try:
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import structlog
 from pathlib import Path
 
@@ -65,6 +65,8 @@ class ModelCache:
                 )
             
             model.to(self._device)
+            if self._device.type == 'cuda':
+                model.half()  # FP16 inference on GPU
             model.eval()
             
             self._loaded_models[cache_key] = (model, tokenizer)
@@ -76,6 +78,47 @@ class ModelCache:
             logger.error("Failed to load model", model=model_name, error=str(e))
             raise
     
+    def encode_batch(
+        self,
+        model_name: str,
+        texts: List[str],
+        task: str = 'classification',
+        max_length: int = 128,
+        batch_size: int = 32
+    ):
+        """
+        Run a text model over many texts with padded batches
+        Returns logits for classification models, mean-pooled embeddings
+        for embedding models, one row per text
+        """
+        if not TRANSFORMERS_AVAILABLE:
+            raise RuntimeError("Transformers not available. ML classification disabled.")
+        
+        model, tokenizer = self.load_text_model(model_name, task)
+        outputs = []
+        
+        with torch.inference_mode():
+            for start in range(0, len(texts), batch_size):
+                batch = tokenizer(
+                    texts[start:start + batch_size],
+                    padding=True,
+                    truncation=True,
+                    max_length=max_length,
+                    return_tensors='pt'
+                ).to(self._device)
+                out = model(**batch)
+                
+                if task == 'embedding':
+                    mask = batch['attention_mask'].unsqueeze(-1).to(out.last_hidden_state.dtype)
+                    pooled = (out.last_hidden_state * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+                    outputs.append(pooled.float().cpu())
+                else:
+                    outputs.append(out.logits.float().cpu())
+        
+        if not outputs:
+            return torch.empty(0)
+        return torch.cat(outputs)
+    
     def clear_cache(self):
         """Clear all loaded models from memory"""
         self._loaded_models.clear()
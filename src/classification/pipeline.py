@@ -1,7 +1,7 @@
 """Main classification pipeline orchestrator"""
 
 import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 import structlog
 from src.classification.models.model_cache import ModelCache
 from src.classification.classifiers.ad_format import AdFormatClassifier
@@ -29,26 +29,12 @@ class ClassificationPipeline:
             models_used.append('rule_based_format')
             
             # Build result
-            result = {
-                'ad_id': ad_data.get('ad_id'),
-                'classifications': {
-                    'ad_format': ad_format,
-                },
-                'extracted_features': {
-                    'keywords': [],
-                    'entities': [],
-                    'call_to_action_type': 'other',
-                    'has_urgency_indicators': False,
-                    'has_pricing': False,
-                    'has_social_proof': False
-                },
-                'classification_metadata': {
-                    'models_used': models_used,
-                    'total_inference_time_ms': int((time.time() - start_time) * 1000),
-                    'requires_review': False,
-                    'review_reason': None
-                }
-            }
+            result = _build_result(
+                ad_data,
+                ad_format,
+                models_used,
+                int((time.time() - start_time) * 1000)
+            )
             
             logger.info("Classification complete",
                        ad_id=ad_data.get('ad_id'),
@@ -62,26 +48,49 @@ class ClassificationPipeline:
                         error=str(e))
             raise
     
-    def classify_batch(self, ads: List[Dict], max_workers: int = 4) -> List[Dict]:
-        """Classify multiple ads in parallel"""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        
-        results = []
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_ad = {
-                executor.submit(self.classify, ad): ad
-                for ad in ads
-            }
-            
-            for future in as_completed(future_to_ad):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    ad = future_to_ad[future]
-                    logger.error("Batch classification failed",
-                                ad_id=ad.get('ad_id'),
-                                error=str(e))
-        
-        return results
+    def classify_batch(
+        self,
+        ads: List[Dict],
+        max_workers: Optional[int] = None,
+        use_threads: bool = False
+    ) -> List[Dict]:
+        """
+        Classify multiple ads one after another; the work is pure Python and
+        holds the GIL, so a thread pool would add overhead without parallelism
+        Ads that fail to classify are logged and left out
+        max_workers and use_threads are accepted for compatibility and ignored
+        """
+        return [result for result in map(self._try_classify, ads) if result is not None]
+    
+    def _try_classify(self, ad: Dict) -> Optional[Dict]:
+        try:
+            return self.classify(ad)
+        except Exception as e:
+            logger.error("Batch classification failed",
+                        ad_id=ad.get('ad_id'),
+                        error=str(e))
+            return None
+
+
+def _build_result(ad_data: Dict, ad_format: Dict, models_used: List[str], duration_ms: int) -> Dict:
+    """Classification result for one ad"""
+    return {
+        'ad_id': ad_data.get('ad_id'),
+        'classifications': {
+            'ad_format': ad_format,
+        },
+        'extracted_features': {
+            'keywords': [],
+            'entities': [],
+            'call_to_action_type': 'other',
+            'has_urgency_indicators': False,
+            'has_pricing': False,
+            'has_social_proof': False
+        },
+        'classification_metadata': {
+            'models_used': models_used,
+            'total_inference_time_ms': duration_ms,
+            'requires_review': False,
+            'review_reason': None
+        }
+    }
@@ -1,14 +1,56 @@
 """Base collector class for all platform collectors"""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator, Callable, Awaitable
 from dataclasses import dataclass
+from datetime import datetime
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import asyncio
 import structlog
-from tenacity import retry, stop_after_attempt, wait_exponential
+import httpx
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+import sys
+import threading
 import time
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = structlog.get_logger()
 
+# Async client of the current run. A context variable keeps concurrent runs
+# of one shared collector (each on its own event loop) apart
+_async_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar('async_client', default=None)
+
+# Every collector talks to a single host, so one pool covers all its connections
+POOL_SIZE = 32
+# Retried by the session's adapter. 429 is left to _make_request's tenacity
+# policy, so each failure is retried in one layer only. The async client has
+# no status retries of its own, so _make_request_async retries 429 and these
+RETRY_STATUSES = (500, 502, 503, 504)
+
+
+def _is_rate_limited(error: BaseException) -> bool:
+    """Whether a request failed with 429 Too Many Requests"""
+    response = getattr(error, 'response', None)
+    return isinstance(error, requests.HTTPError) and response is not None and response.status_code == 429
+
+
+def _is_retryable_async(error: BaseException) -> bool:
+    """Whether an async request failed with 429 or one of RETRY_STATUSES"""
+    return (
+        isinstance(error, httpx.HTTPStatusError)
+        and (error.response.status_code == 429 or error.response.status_code in RETRY_STATUSES)
+    )
+
 
 @dataclass
 class CollectionConfig:
@@ -19,42 +61,107 @@ class CollectionConfig:
     start_date: Optional[str] = None
     end_date: Optional[str] = None
     rate_limit_per_second: float = 0.5
+    concurrency: int = 4  # Keywords fetched at once by async collectors
+    simulate_delay: bool = False  # MockAdCollector: sleep like a real scraper between ads
+    seed: Optional[int] = None  # MockAdCollector: reproducible data; None uses the random module
 
 
 class BaseCollector(ABC):
     """Abstract base class for all platform collectors"""
     
+    # Multiplex async requests over HTTP/2 when the host supports it and h2 is installed
+    HTTP2 = False
+    
     def __init__(self, config: CollectionConfig):
         self.config = config
         self.logger = logger.bind(platform=config.platform)
-        self._last_request_time = 0
+        # One shared, immutable tuple of interned keywords. normalize() puts this same
+        # object in every ad's detected_keywords, so it must never be copied or mutated
+        self.keywords = tuple(sys.intern(keyword) for keyword in config.keywords)
+        self._next_request_slot = 0.0  # time.monotonic() of the next free request slot
+        self._rate_lock = threading.Lock()
+        
+        # One keep-alive session per collector, shared by every request it makes.
+        # Connection failures and 5xx responses are retried on the pooled connection by urllib3
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=RETRY_STATUSES,
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['Connection'] = 'keep-alive'
     
     @abstractmethod
-    def collect(self) -> List[Dict]:
+    def collect(self) -> Iterable[Dict]:
         """
         Main collection method - must be implemented by subclasses
-        Returns: List of raw ad data dictionaries
+        Returns: List (or generator) of raw ad data dictionaries
+        Prefer a generator that stops at max_results: stream() normalizes and
+        hands on each ad as soon as it is yielded
         """
         pass
     
     @abstractmethod
-    def normalize(self, raw_data: Dict) -> Dict:
+    def normalize(self, raw_data: Dict, collected_at: Optional[str] = None) -> Dict:
         """
         Transform platform-specific data to standardized schema
+        collected_at is the batch timestamp; the current time is used if omitted
         Returns: Normalized ad data dictionary
         """
         pass
     
+    def normalize_many(self, raw_items: Iterable[Dict]) -> List[Dict]:
+        """
+        Normalize a batch of raw ads, stamping them all with one collected_at
+        Items that fail to normalize are skipped and logged once for the batch
+        """
+        collected_at = datetime.utcnow().isoformat()
+        normalize = self.normalize
+        results = []
+        failed_ids = []
+        last_error = None
+        
+        for item in raw_items:
+            try:
+                results.append(normalize(item, collected_at))
+            except Exception as e:
+                failed_ids.append(item.get('id'))
+                last_error = e
+        
+        self._log_normalization_failures(failed_ids, last_error)
+        return results
+    
+    def _reserve_request_slot(self) -> float:
+        """
+        Claim the next request slot and return how long to wait for it
+        Slots are spaced 1 / rate_limit_per_second apart; time already spent
+        since the last request counts towards the gap, so there is no fixed sleep
+        """
+        if self.config.rate_limit_per_second <= 0:
+            return 0.0
+        
+        min_interval = 1.0 / self.config.rate_limit_per_second
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_slot)
+            self._next_request_slot = slot + min_interval
+        return slot - now
+    
     def _apply_rate_limit(self):
         """Apply rate limiting between requests"""
-        if self.config.rate_limit_per_second > 0:
-            min_interval = 1.0 / self.config.rate_limit_per_second
-            elapsed = time.time() - self._last_request_time
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
-        self._last_request_time = time.time()
+        wait = self._reserve_request_slot()
+        if wait > 0:
+            time.sleep(wait)
     
     @retry(
+        retry=retry_if_exception(_is_rate_limited),  # Everything else was retried by the adapter
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
     )
@@ -63,17 +170,149 @@ class BaseCollector(ABC):
         HTTP request wrapper with retry logic
         Implement rate limiting and error handling here
         """
-        import requests
-        
         self._apply_rate_limit()
         
         try:
-            response = requests.get(url, timeout=10, **kwargs)
+            response = self.session.get(url, timeout=10, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
-            self.logger.error("Request failed", url=url, error=str(e))
+            # Only 429 is retried here, the rest already was by the adapter; the caller logs it
+            self.logger.debug("Request attempt failed", url=url, error=str(e))
+            raise
+    
+    async def _apply_rate_limit_async(self):
+        """Async rate limiting: each request waits for its own slot, without blocking the others"""
+        wait = self._reserve_request_slot()
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    @retry(
+        retry=retry_if_exception(_is_retryable_async),  # The transport retries connections
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10)
+    )
+    async def _make_request_async(self, url: str, **kwargs) -> Dict:
+        """
+        Async HTTP request over the collector's pooled client. 429 and 5xx
+        responses are retried with backoff, other errors are raised at once.
+        Only valid inside _async_session
+        """
+        await self._apply_rate_limit_async()
+        
+        try:
+            response = await self._async_client.get(url, **kwargs)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            self.logger.debug("Request attempt failed", url=url, error=str(e))
+            raise
+    
+    @property
+    def _async_client(self) -> Optional[httpx.AsyncClient]:
+        """Pooled async client of the current run, None outside _async_session"""
+        return _async_client.get()
+    
+    @asynccontextmanager
+    async def _async_session(self):
+        """Open one keep-alive client, with the session's headers, for a run"""
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=POOL_SIZE,
+                max_keepalive_connections=POOL_SIZE,
+                keepalive_expiry=60
+            ),
+            retries=3,  # Connection failures only; status codes are handled by callers
+            http2=self.HTTP2 and HTTP2_AVAILABLE
+        )
+        client = httpx.AsyncClient(timeout=10.0, headers=dict(self.session.headers), transport=transport)
+        client_token = _async_client.set(client)
+        try:
+            yield client
+        finally:
+            await client.aclose()
+            _async_client.reset(client_token)
+    
+    async def _gather_keywords(
+        self,
+        collect_keyword: Callable[[str], Awaitable[List[Dict]]]
+    ) -> List[Dict]:
+        """
+        Run collect_keyword for every configured keyword concurrently, at most
+        config.concurrency at a time. Ads come back in keyword order, capped
+        at max_results
+        """
+        semaphore = asyncio.Semaphore(self.config.concurrency)
+        
+        async def bounded(keyword: str) -> List[Dict]:
+            async with semaphore:
+                return await collect_keyword(keyword)
+        
+        per_keyword = await asyncio.gather(*(bounded(keyword) for keyword in self.config.keywords))
+        return [ad for ads in per_keyword for ad in ads][:self.config.max_results]
+    
+    def _run_collect_async(self) -> List[Dict]:
+        """Sync entry point for collectors whose collect() is implemented by collect_async"""
+        async def main() -> List[Dict]:
+            async with self._async_session():
+                return list(await self.collect_async())
+        
+        return asyncio.run(main())
+    
+    async def collect_async(self) -> Iterable[Dict]:
+        """
+        Async collection - override to fetch keywords concurrently with
+        _gather_keywords, then implement collect() as self._run_collect_async()
+        Defaults to running collect() in a worker thread
+        """
+        return await asyncio.to_thread(lambda: list(self.collect()))
+    
+    async def run_async(self) -> List[Dict]:
+        """Async counterpart of run(), sharing one keep-alive client across requests"""
+        self.logger.info("Starting collection", keywords=self.config.keywords)
+        
+        try:
+            async with self._async_session():
+                raw_items = await self.collect_async()
+        except Exception as e:
+            self.logger.error("Collection failed", error=str(e))
             raise
+        
+        results = self.normalize_many(raw_items)
+        
+        self.logger.info("Collection complete",
+                       total_collected=len(raw_items),
+                       successfully_normalized=len(results))
+        return results
+    
+    def stream(self) -> Iterator[Dict]:
+        """
+        Collect and normalize ads lazily, yielding each ad as soon as it is
+        normalized so downstream stages can start before collection finishes
+        """
+        self.logger.info("Starting collection", keywords=self.config.keywords)
+        collected_at = datetime.utcnow().isoformat()  # One timestamp for the whole run
+        normalize = self.normalize
+        total_collected = 0
+        successfully_normalized = 0
+        failed_ids = []
+        last_error = None
+        
+        for item in self.collect():
+            total_collected += 1
+            try:
+                normalized = normalize(item, collected_at)
+            except Exception as e:
+                failed_ids.append(item.get('id'))
+                last_error = e
+                continue
+            successfully_normalized += 1
+            yield normalized
+        
+        self._log_normalization_failures(failed_ids, last_error)
+        self.logger.info("Collection complete", 
+                       total_collected=total_collected,
+                       successfully_normalized=successfully_normalized)
     
     def run(self) -> List[Dict]:
         """
@@ -84,25 +323,21 @@ class BaseCollector(ABC):
         4. Return processed data
         """
         try:
-            self.logger.info("Starting collection", keywords=self.config.keywords)
-            raw_data = self.collect()
-            
-            normalized_data = []
-            for item in raw_data:
-                try:
-                    normalized = self.normalize(item)
-                    normalized_data.append(normalized)
-                except Exception as e:
-                    self.logger.error("Normalization failed", 
-                                    item_id=item.get('id'), 
-                                    error=str(e))
-            
-            self.logger.info("Collection complete", 
-                           total_collected=len(raw_data),
-                           successfully_normalized=len(normalized_data))
-            
-            return normalized_data
-            
+            return list(self.stream())
         except Exception as e:
             self.logger.error("Collection failed", error=str(e))
             raise
+        finally:
+            self.close()
+    
+    def _log_normalization_failures(self, failed_ids: List, last_error: Optional[Exception]):
+        """One log line per collection for items that failed to normalize, not one per item"""
+        if failed_ids:
+            self.logger.error("Normalization failed",
+                            count=len(failed_ids),
+                            sample_ids=failed_ids[:5],
+                            error=str(last_error))
+    
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.session.close()
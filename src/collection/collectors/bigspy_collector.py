@@ -1,11 +1,21 @@
 """BigSpy web scraper for competitor ad intelligence"""
 
-import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
+from types import MappingProxyType
 from datetime import datetime
-from bs4 import BeautifulSoup
-import time
+import orjson
 from src.collection.collectors.base_collector import BaseCollector, CollectionConfig
+from src.collection.page_cache import memoize_page
+
+
+# Fields that are the same for every normalized BigSpy ad, shared rather than rebuilt per ad.
+# Empty collections are tuples so no ad can mutate another's
+_STATIC_FIELDS = MappingProxyType({
+    "spend_range": None,
+    "collection_status": "success",
+    "validation_errors": (),
+    "retry_count": 0
+})
 
 
 class BigSpyCollector(BaseCollector):
@@ -20,14 +30,14 @@ class BigSpyCollector(BaseCollector):
     
     def __init__(self, config: CollectionConfig):
         super().__init__(config)
-        self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'application/json',
             'Referer': 'https://bigspy.com/'
         })
     
-    def _fetch_ads_page(self, keyword: str, page: int = 1) -> Dict:
+    @memoize_page(key_prefix="bigspy")
+    async def _fetch_ads_page(self, keyword: str, page: int = 1) -> Dict:
         """Fetch one page of ads from BigSpy"""
         
         params = {
@@ -39,11 +49,12 @@ class BigSpyCollector(BaseCollector):
         }
         
         try:
-            self._apply_rate_limit()
-            response = self.session.get(self.SEARCH_URL, params=params, timeout=15)
+            await self._apply_rate_limit_async()
+            response = await self._async_client.get(self.SEARCH_URL, params=params, timeout=15)
             
             if response.status_code == 200:
-                return response.json()
+                # Keep only the ads, so cached pages don't hold the rest of the body
+                return {"data": orjson.loads(response.content).get('data') or []}
             else:
                 self.logger.warning(f"BigSpy returned status {response.status_code}")
                 return {"data": []}
@@ -52,46 +63,57 @@ class BigSpyCollector(BaseCollector):
             self.logger.error("BigSpy request failed", keyword=keyword, error=str(e))
             return {"data": []}
     
-    def collect(self) -> List[Dict]:
-        """Collect ads for all configured keywords"""
-        all_ads = []
+    async def _collect_keyword(self, keyword: str) -> List[Dict]:
+        """Page through the ads for one keyword"""
+        self.logger.info("Collecting ads from BigSpy", keyword=keyword, platform="bigspy")
+        keyword_ads = []
+        page = 1
         
-        for keyword in self.config.keywords:
-            self.logger.info("Collecting ads from BigSpy", keyword=keyword, platform="bigspy")
-            page = 1
+        while len(keyword_ads) < self.config.max_results:
+            response = await self._fetch_ads_page(keyword, page)
+            ads = response.get('data', [])
             
-            while len(all_ads) < self.config.max_results:
-                response = self._fetch_ads_page(keyword, page)
-                ads = response.get('data', [])
-                
-                if not ads:
-                    self.logger.info("No more ads found", keyword=keyword, page=page)
-                    break
-                
-                all_ads.extend(ads)
-                
-                self.logger.info("Fetched page", 
-                               keyword=keyword, 
-                               page=page,
-                               ads_count=len(ads),
-                               total_so_far=len(all_ads))
-                
-                page += 1
-                time.sleep(1)  # Be respectful with rate limiting
-                
-                if page > 5:  # Limit to 5 pages per keyword
-                    break
+            if not ads:
+                self.logger.info("No more ads found", keyword=keyword, page=page)
+                break
+            
+            keyword_ads.extend(ads)
+            
+            self.logger.info("Fetched page", 
+                           keyword=keyword, 
+                           page=page,
+                           ads_count=len(ads),
+                           total_so_far=len(keyword_ads))
+            
+            # Pages have a fixed size (offsets depend on it), so trim the last one instead
+            if len(keyword_ads) >= self.config.max_results:
+                del keyword_ads[self.config.max_results:]
+                break
+            
+            page += 1
+            
+            if page > 5:  # Limit to 5 pages per keyword
+                break
         
-        return all_ads[:self.config.max_results]
+        return keyword_ads
+    
+    async def collect_async(self) -> List[Dict]:
+        """Collect ads for all configured keywords concurrently"""
+        return await self._gather_keywords(self._collect_keyword)
     
-    def normalize(self, raw_data: Dict) -> Dict:
+    def collect(self) -> List[Dict]:
+        """Collect ads for all configured keywords"""
+        return self._run_collect_async()
+    
+    def normalize(self, raw_data: Dict, collected_at: Optional[str] = None) -> Dict:
         """Transform BigSpy data to standard schema"""
         
         return {
+            **_STATIC_FIELDS,
             "ad_id": f"bigspy_{raw_data.get('id', 'unknown')}",
             "platform": raw_data.get('platform', 'facebook'),
             "source_url": raw_data.get('url', ''),
-            "collected_at": datetime.utcnow().isoformat(),
+            "collected_at": collected_at or datetime.utcnow().isoformat(),
             "raw_data": raw_data,
             
             # Content
@@ -104,16 +126,10 @@ class BigSpyCollector(BaseCollector):
             # Metadata
             "brand_name": raw_data.get('advertiser', ''),
             "page_name": raw_data.get('page_name', ''),
-            "detected_keywords": self.config.keywords,
+            "detected_keywords": self.keywords,
             "start_date": raw_data.get('first_seen', ''),
             "end_date": raw_data.get('last_seen', ''),
             
             # Engagement (if available)
-            "impressions": raw_data.get('impressions'),
-            "spend_range": None,
-            
-            # System
-            "collection_status": "success",
-            "validation_errors": [],
-            "retry_count": 0
+            "impressions": raw_data.get('impressions')
         }
@@ -1,11 +1,43 @@
 """Google Ads Transparency Center scraper"""
 
-import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
+from types import MappingProxyType
 from datetime import datetime
 from bs4 import BeautifulSoup
-import time
 from src.collection.collectors.base_collector import BaseCollector, CollectionConfig
+from src.collection.page_cache import memoize_page
+
+try:
+    from lxml import etree, html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+if LXML_AVAILABLE:
+    # Compiled once; same matches as soup.find_all('div', class_='ad-item')
+    # and the first h3 / p / a under each ad
+    XPATH_ADS = etree.XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' ad-item ')]")
+    XPATH_TITLE = etree.XPath("string((.//h3)[1])", smart_strings=False)
+    XPATH_DESC = etree.XPath("string((.//p)[1])", smart_strings=False)
+    XPATH_HREF = etree.XPath("(.//a)[1]/@href", smart_strings=False)
+
+
+# Anything smaller is an error stub rather than a results page
+MIN_PAGE_BYTES = 1024
+# Landing on one of these means the request was bounced to a captcha
+BLOCKED_URL_MARKERS = ('captcha', '/sorry/')
+
+
+# Fields that are the same for every normalized Google ad, shared rather than rebuilt per ad.
+# Empty collections are tuples so no ad can mutate another's
+_STATIC_FIELDS = MappingProxyType({
+    "platform": "google",
+    "call_to_action": '',
+    "media_urls": (),
+    "collection_status": "success",
+    "validation_errors": (),
+    "retry_count": 0
+})
 
 
 class GoogleAdsCollector(BaseCollector):
@@ -19,96 +51,124 @@ class GoogleAdsCollector(BaseCollector):
     
     def __init__(self, config: CollectionConfig):
         super().__init__(config)
-        self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml',
         })
         self.logger.info("Using GoogleAdsCollector - scraping Google Ads Transparency Center")
     
-    def _search_ads(self, keyword: str) -> List[Dict]:
+    @memoize_page(key_prefix="google", maxsize=128)
+    async def _fetch_search_page(self, keyword: str) -> str:
+        """Search results HTML for a keyword, or '' if Google did not return a page"""
+        await self._apply_rate_limit_async()
+        
+        # Note: This is a simplified example. The actual Google Ads Transparency Center
+        # may require more complex scraping or API calls
+        search_url = f"{self.BASE_URL}/search?q={keyword}&region=US"
+        
+        response = await self._async_client.get(search_url, timeout=15)
+        
+        if response.status_code != 200:
+            self.logger.warning(f"Google Ads returned status {response.status_code}")
+            return ''
+        
+        # Error, captcha and non-HTML responses hold no ads; don't spend a parse on them
+        if ('text/html' not in response.headers.get('Content-Type', '')
+                or len(response.content) < MIN_PAGE_BYTES
+                or any(marker in str(response.url) for marker in BLOCKED_URL_MARKERS)):
+            self.logger.warning("Google Ads returned no results page", url=str(response.url))
+            return ''
+        return response.text
+    
+    async def _search_ads(self, keyword: str) -> List[Dict]:
         """Search for ads by keyword"""
         
         try:
-            self._apply_rate_limit()
-            
-            # Note: This is a simplified example. The actual Google Ads Transparency Center
-            # may require more complex scraping or API calls
-            search_url = f"{self.BASE_URL}/search?q={keyword}&region=US"
-            
-            response = self.session.get(search_url, timeout=15)
-            
-            if response.status_code != 200:
-                self.logger.warning(f"Google Ads returned status {response.status_code}")
+            page = await self._fetch_search_page(keyword)
+            if not page:
                 return []
             
             # Parse HTML to extract ad data
-            soup = BeautifulSoup(response.text, 'html.parser')
-            ads = []
-            
             # This is a placeholder - actual implementation would need to parse
             # the specific HTML structure of Google Ads Transparency Center
-            ad_elements = soup.find_all('div', class_='ad-item')  # Example selector
-            
-            for ad_elem in ad_elements[:self.config.max_results]:
-                ad_data = {
-                    'id': ad_elem.get('data-id', 'unknown'),
-                    'title': ad_elem.find('h3').text if ad_elem.find('h3') else '',
-                    'description': ad_elem.find('p').text if ad_elem.find('p') else '',
-                    'advertiser': ad_elem.get('data-advertiser', ''),
-                    'url': ad_elem.find('a')['href'] if ad_elem.find('a') else '',
-                }
-                ads.append(ad_data)
-            
-            return ads
+            if LXML_AVAILABLE:
+                return self._parse_ads(page)
+            return self._parse_ads_soup(page)
             
         except Exception as e:
             self.logger.error("Google Ads scraping failed", keyword=keyword, error=str(e))
             return []
     
-    def collect(self) -> List[Dict]:
-        """Collect ads for all configured keywords"""
-        all_ads = []
+    def _parse_ads(self, page: str) -> List[Dict]:
+        """Extract ads with one compiled XPath pass over the lxml tree"""
+        tree = lxml_html.fromstring(page)
+        ads = []
         
-        for keyword in self.config.keywords:
-            self.logger.info("Collecting ads from Google Transparency", keyword=keyword)
-            
-            ads = self._search_ads(keyword)
-            all_ads.extend(ads)
-            
-            self.logger.info(f"Collected {len(ads)} ads for keyword: {keyword}")
-            
-            time.sleep(2)  # Be respectful with rate limiting
-            
-            if len(all_ads) >= self.config.max_results:
-                break
+        for ad_elem in XPATH_ADS(tree)[:self.config.max_results]:
+            href = XPATH_HREF(ad_elem)
+            ads.append({
+                'id': ad_elem.get('data-id', 'unknown'),
+                'title': XPATH_TITLE(ad_elem),
+                'description': XPATH_DESC(ad_elem),
+                'advertiser': ad_elem.get('data-advertiser', ''),
+                'url': href[0] if href else '',
+            })
+        
+        return ads
+    
+    def _parse_ads_soup(self, page: str) -> List[Dict]:
+        """BeautifulSoup fallback for when lxml is not installed"""
+        soup = BeautifulSoup(page, 'html.parser')
+        ads = []
+        
+        for ad_elem in soup.find_all('div', class_='ad-item')[:self.config.max_results]:
+            title = ad_elem.find('h3')
+            description = ad_elem.find('p')
+            link = ad_elem.find('a')
+            ads.append({
+                'id': ad_elem.get('data-id', 'unknown'),
+                'title': title.text if title else '',
+                'description': description.text if description else '',
+                'advertiser': ad_elem.get('data-advertiser', ''),
+                'url': link['href'] if link else '',
+            })
         
-        return all_ads[:self.config.max_results]
+        return ads
     
-    def normalize(self, raw_data: Dict) -> Dict:
+    async def _collect_keyword(self, keyword: str) -> List[Dict]:
+        """Search one keyword"""
+        self.logger.info("Collecting ads from Google Transparency", keyword=keyword)
+        
+        ads = await self._search_ads(keyword)
+        
+        self.logger.info(f"Collected {len(ads)} ads for keyword: {keyword}")
+        return ads
+    
+    async def collect_async(self) -> List[Dict]:
+        """Collect ads for all configured keywords concurrently"""
+        return await self._gather_keywords(self._collect_keyword)
+    
+    def collect(self) -> List[Dict]:
+        """Collect ads for all configured keywords"""
+        return self._run_collect_async()
+    
+    def normalize(self, raw_data: Dict, collected_at: Optional[str] = None) -> Dict:
         """Transform Google Ads data to standard schema"""
         
         return {
+            **_STATIC_FIELDS,
             "ad_id": f"google_{raw_data.get('id', 'unknown')}",
-            "platform": "google",
             "source_url": raw_data.get('url', ''),
-            "collected_at": datetime.utcnow().isoformat(),
+            "collected_at": collected_at or datetime.utcnow().isoformat(),
             "raw_data": raw_data,
             
             # Content
             "headline": raw_data.get('title', ''),
             "body_text": raw_data.get('description', ''),
-            "call_to_action": '',
-            "media_urls": [],
             "landing_page": raw_data.get('url', ''),
             
             # Metadata
             "brand_name": raw_data.get('advertiser', ''),
             "page_name": raw_data.get('advertiser', ''),
-            "detected_keywords": self.config.keywords,
-            
-            # System
-            "collection_status": "success",
-            "validation_errors": [],
-            "retry_count": 0
+            "detected_keywords": self.keywords
         }
@@ -1,11 +1,31 @@
 """Meta Ad Library collector implementation"""
 
-import requests
+import asyncio
 import os
-from typing import List, Dict
+import httpx
+import orjson
+from typing import List, Dict, Optional
+from types import MappingProxyType
 from datetime import datetime
 from ratelimit import limits, sleep_and_retry
 from src.collection.collectors.base_collector import BaseCollector, CollectionConfig
+from src.collection.page_cache import memoize_page
+
+
+# Fields that are the same for every normalized Meta Ad Library ad, shared rather than rebuilt per ad.
+# Empty collections are tuples so no ad can mutate another's
+_STATIC_FIELDS = MappingProxyType({
+    "platform": "meta",
+    "media_urls": (),  # Graph API doesn't directly provide image URLs in basic response
+    "landing_page": None,  # Not in basic fields
+    "collection_status": "success",
+    "validation_errors": (),
+    "retry_count": 0
+})
+
+
+# Largest page requested from the Graph API
+PAGE_SIZE = 30
 
 
 class MetaAdLibraryCollector(BaseCollector):
@@ -16,10 +36,10 @@ class MetaAdLibraryCollector(BaseCollector):
     """
     
     BASE_URL = "https://graph.facebook.com/v18.0/ads_archive"
+    HTTP2 = True  # Concurrent keyword pages share one connection to the Graph API
     
     def __init__(self, config: CollectionConfig):
         super().__init__(config)
-        self.session = requests.Session()
         
         # Get access token from environment variable
         self.access_token = os.getenv('META_ACCESS_TOKEN')
@@ -36,14 +56,18 @@ class MetaAdLibraryCollector(BaseCollector):
     
     @sleep_and_retry
     @limits(calls=200, period=3600)  # 200 requests per hour
-    def _fetch_ads_page(self, keyword: str, after: str = None) -> Dict:
-        """Fetch one page of ads from Meta Ad Library using Graph API"""
+    def _reserve_request(self):
+        """Block until the hourly Graph API quota allows another request"""
+    
+    @memoize_page(key_prefix="meta")
+    async def _fetch_ads_page(self, keyword: str, after: str = None, limit: int = PAGE_SIZE) -> Dict:
+        """Fetch one page of up to limit ads from Meta Ad Library using Graph API"""
         
         params = {
             'search_terms': keyword,
             'ad_reached_countries': "['US']",
             'ad_active_status': 'ALL',
-            'limit': 30,
+            'limit': limit,
             'fields': 'id,ad_creative_bodies,ad_creative_link_captions,ad_creative_link_descriptions,ad_creative_link_titles,ad_delivery_start_time,ad_delivery_stop_time,ad_snapshot_url,currency,funding_entity,page_name,impressions,spend'
         }
         
@@ -56,56 +80,68 @@ class MetaAdLibraryCollector(BaseCollector):
             params['after'] = after
         
         try:
-            self._apply_rate_limit()
-            response = self.session.get(self.BASE_URL, params=params, timeout=15)
+            # Waiting on the hourly quota happens off the event loop
+            await asyncio.to_thread(self._reserve_request)
+            await self._apply_rate_limit_async()
+            response = await self._async_client.get(self.BASE_URL, params=params, timeout=15)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            page = orjson.loads(response.content)
+            # Only the ads and the cursor are used; the rest is dropped before caching
+            return {'data': page.get('data') or [], 'paging': page.get('paging') or {}}
+        except httpx.HTTPError as e:
             self.logger.error("API request failed", keyword=keyword, error=str(e))
             raise
     
-    def collect(self) -> List[Dict]:
-        """Collect ads for all configured keywords"""
-        all_ads = []
+    async def _collect_keyword(self, keyword: str) -> List[Dict]:
+        """Follow the pagination cursor for one keyword"""
+        self.logger.info("Collecting ads", keyword=keyword, platform="meta")
+        keyword_ads = []
+        after_cursor = None
         
-        for keyword in self.config.keywords:
-            self.logger.info("Collecting ads", keyword=keyword, platform="meta")
-            after_cursor = None
-            
-            while len(all_ads) < self.config.max_results:
-                try:
-                    response = self._fetch_ads_page(keyword, after_cursor)
-                    
-                    # Graph API returns data in 'data' field
-                    ads = response.get('data', [])
-                    if not ads:
-                        self.logger.info("No more ads found", keyword=keyword)
-                        break
-                    
-                    all_ads.extend(ads)
-                    
-                    self.logger.info("Fetched page", 
-                                   keyword=keyword, 
-                                   ads_count=len(ads),
-                                   total_so_far=len(all_ads))
-                    
-                    # Check for pagination cursor
-                    paging = response.get('paging', {})
-                    after_cursor = paging.get('cursors', {}).get('after')
-                    
-                    if not after_cursor:
-                        self.logger.info("No more pages available", keyword=keyword)
-                        break
-                    
-                except Exception as e:
-                    self.logger.error("Failed to fetch page", 
-                                    keyword=keyword, 
-                                    error=str(e))
+        while len(keyword_ads) < self.config.max_results:
+            try:
+                # Ask only for what is still missing, so the last page doesn't over-fetch
+                remaining = self.config.max_results - len(keyword_ads)
+                response = await self._fetch_ads_page(keyword, after_cursor, min(PAGE_SIZE, remaining))
+                
+                # Graph API returns data in 'data' field
+                ads = response.get('data', [])
+                if not ads:
+                    self.logger.info("No more ads found", keyword=keyword)
+                    break
+                
+                keyword_ads.extend(ads)
+                
+                self.logger.info("Fetched page", 
+                               keyword=keyword, 
+                               ads_count=len(ads),
+                               total_so_far=len(keyword_ads))
+                
+                # Check for pagination cursor
+                paging = response.get('paging', {})
+                after_cursor = paging.get('cursors', {}).get('after')
+                
+                if not after_cursor:
+                    self.logger.info("No more pages available", keyword=keyword)
                     break
+                
+            except Exception as e:
+                self.logger.error("Failed to fetch page", 
+                                keyword=keyword, 
+                                error=str(e))
+                break
         
-        return all_ads[:self.config.max_results]
+        return keyword_ads[:self.config.max_results]
     
-    def normalize(self, raw_data: Dict) -> Dict:
+    async def collect_async(self) -> List[Dict]:
+        """Collect ads for all configured keywords concurrently"""
+        return await self._gather_keywords(self._collect_keyword)
+    
+    def collect(self) -> List[Dict]:
+        """Collect ads for all configured keywords"""
+        return self._run_collect_async()
+    
+    def normalize(self, raw_data: Dict, collected_at: Optional[str] = None) -> Dict:
         """Transform Meta Ad Library Graph API data to standard schema"""
         
         # Extract text from ad creative bodies
@@ -140,33 +176,26 @@ class MetaAdLibraryCollector(BaseCollector):
             }
         
         return {
+            **_STATIC_FIELDS,
             "ad_id": f"meta_{raw_data.get('id')}",
-            "platform": "meta",
             "source_url": raw_data.get('ad_snapshot_url'),
-            "collected_at": datetime.utcnow().isoformat(),
+            "collected_at": collected_at or datetime.utcnow().isoformat(),
             "raw_data": raw_data,
             
             # Content
             "headline": headline,
             "body_text": body_text,
             "call_to_action": call_to_action,
-            "media_urls": [],  # Graph API doesn't directly provide image URLs in basic response
-            "landing_page": None,  # Not in basic fields
             
             # Metadata
             "brand_name": raw_data.get('page_name'),
             "page_name": raw_data.get('page_name'),
             "funding_entity": raw_data.get('funding_entity'),
-            "detected_keywords": self.config.keywords,
+            "detected_keywords": self.keywords,
             "start_date": raw_data.get('ad_delivery_start_time'),
             "end_date": raw_data.get('ad_delivery_stop_time'),
             
             # Engagement
             "impressions": impressions,
-            "spend_range": spend_range,
-            
-            # System
-            "collection_status": "success",
-            "validation_errors": [],
-            "retry_count": 0
+            "spend_range": spend_range
         }
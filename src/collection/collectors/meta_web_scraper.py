@@ -1,8 +1,12 @@
 """Meta Ad Library web scraper - No authentication required"""
 
+import html
 import time
-import json
-from typing import List, Dict
+import orjson
+import re
+import uuid
+from typing import List, Dict, Optional, Iterator, Tuple
+from types import MappingProxyType
 from datetime import datetime
 
 try:
@@ -20,22 +24,83 @@ except ImportError:
 
 from src.collection.collectors.base_collector import BaseCollector, CollectionConfig
 
+# Tokens embedded in the public Ad Library page, required by its search endpoint
+LSD_TOKEN = re.compile(r'"LSD",\[\],\{"token":"([^"]+)"')
+DTSG_TOKEN = re.compile(r'"DTSGInitialData",\[\],\{"token":"([^"]+)"')
+HTML_TAG = re.compile(r'<[^>]+>')
+JSON_GUARD = 'for (;;);'
+
+# Selenium fallback: ad container selectors, in order of preference
+AD_CONTAINER_SELECTORS = ('[role="article"]', 'div[data-testid]')
+PAGE_LOAD_TIMEOUT = 10
+SCROLL_TIMEOUT = 3
+
+# Finds the ad containers (first selector with matches) and reads everything
+# _extract_ad_data needs from up to arguments[1] of them, in one WebDriver round-trip.
+# An ad that fails to read comes back as its error message
+EXTRACT_ADS_JS = """
+const [selectors, limit] = arguments;
+let containers = [];
+for (const selector of selectors) {
+    containers = document.querySelectorAll(selector);
+    if (containers.length) break;
+}
+const ads = Array.from(containers).slice(0, limit).map(el => {
+    try {
+        const texts = sel => Array.from(el.querySelectorAll(sel)).map(e => e.innerText.trim());
+        const paragraphs = texts('p');
+        const link = el.querySelector('a');
+        const pageLink = el.querySelector('a[role="link"]');
+        const images = Array.from(el.querySelectorAll('img'));
+        return {
+            full_text: texts('span').filter(Boolean).join(' '),
+            bodies: paragraphs.length ? paragraphs.filter(Boolean) : null,
+            href: link ? link.href : null,
+            images: images.length ? images.map(i => i.src).filter(Boolean) : null,
+            page_name: pageLink ? pageLink.innerText : null
+        };
+    } catch (e) {
+        return String(e);
+    }
+});
+return {found: containers.length, ads: ads};
+"""
+
+
+# Fields that are the same for every normalized scraped Meta ad, shared rather than rebuilt per ad.
+# Empty collections are tuples so no ad can mutate another's
+_STATIC_FIELDS = MappingProxyType({
+    "platform": "meta_web",
+    "call_to_action": '',
+    "landing_page": '',
+    "collection_status": "success",
+    "validation_errors": (),
+    "retry_count": 0
+})
+
 
 class MetaWebScraper(BaseCollector):
     """
     Web scraper for Meta Ad Library
     No authentication required - scrapes public website
-    Uses Selenium for dynamic content
+    Reads the JSON search endpoint the website itself loads ads from, and
+    only falls back to rendering the page with Selenium when that fails
     """
     
     BASE_URL = "https://www.facebook.com/ads/library/"
+    SEARCH_API_URL = "https://www.facebook.com/ads/library/async/search_ads/"
+    PAGE_SIZE = 30
     
     def __init__(self, config: CollectionConfig):
         super().__init__(config)
         if not SELENIUM_AVAILABLE:
-            self.logger.error("Selenium not available. MetaWebScraper cannot be used.")
-            raise ImportError("Selenium is required for MetaWebScraper but is not installed")
+            self.logger.warning("Selenium not available. MetaWebScraper will only use the search endpoint.")
         self.driver = None
+        self._tokens: Optional[Dict[str, str]] = None
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept-Language': 'en-US,en;q=0.9',
+        })
         self.logger.info("Using MetaWebScraper - scraping public Meta Ad Library website")
     
     def _init_driver(self):
@@ -62,8 +127,95 @@ class MetaWebScraper(BaseCollector):
             self.logger.info("Make sure Chrome browser is installed on your system")
             raise Exception("Could not initialize WebDriver. Please install Chrome browser.")
     
+    def _fetch_tokens(self) -> Optional[Dict[str, str]]:
+        """Request tokens from the public Ad Library page, fetched once per scraper"""
+        if self._tokens is not None:
+            return self._tokens
+        
+        try:
+            self._apply_rate_limit()
+            response = self.session.get(self.BASE_URL, timeout=15)
+            response.raise_for_status()
+        except Exception as e:
+            self.logger.warning("Could not load Ad Library page for tokens", error=str(e))
+            return None
+        
+        lsd = LSD_TOKEN.search(response.text)
+        if not lsd:
+            self.logger.warning("Ad Library page did not contain a request token")
+            return None
+        
+        self._tokens = {'lsd': lsd.group(1)}
+        dtsg = DTSG_TOKEN.search(response.text)
+        if dtsg:
+            self._tokens['fb_dtsg'] = dtsg.group(1)
+        return self._tokens
+    
+    def _search_ads_api(self, keyword: str) -> Optional[List[Dict]]:
+        """
+        Search through the Ad Library's JSON endpoint, following forward_cursor
+        Returns None if the endpoint could not be used, so the caller can fall back
+        """
+        tokens = self._fetch_tokens()
+        if tokens is None:
+            return None
+        
+        session_id = str(uuid.uuid4())
+        scraped_at = datetime.utcnow().isoformat()
+        cursor = None
+        ads = []
+        
+        while len(ads) < self.config.max_results:
+            params = {
+                'q': keyword,
+                'count': self.PAGE_SIZE,
+                'active_status': 'all',
+                'ad_type': 'all',
+                'countries[0]': 'US',
+                'media_type': 'all',
+                'search_type': 'keyword_unordered',
+                'session_id': session_id,
+            }
+            if cursor:
+                params['forward_cursor'] = cursor
+            
+            try:
+                self._apply_rate_limit()
+                response = self.session.post(
+                    self.SEARCH_API_URL,
+                    params=params,
+                    data={'__a': 1, **tokens},
+                    headers={'X-FB-LSD': tokens['lsd']},
+                    timeout=15
+                )
+                response.raise_for_status()
+                page_ads, cursor = _parse_search_response(response.text, scraped_at)
+            except Exception as e:
+                self.logger.warning("Ad Library search endpoint failed", keyword=keyword, error=str(e))
+                # Tokens may have expired; a later keyword fetches new ones
+                self._tokens = None
+                return ads or None
+            
+            ads.extend(page_ads)
+            if not page_ads or not cursor:
+                break
+        
+        self.logger.info(f"Fetched {len(ads)} ads from the search endpoint", keyword=keyword)
+        return ads[:self.config.max_results]
+    
     def _search_ads(self, keyword: str, max_scroll: int = 5) -> List[Dict]:
-        """Search for ads on Meta Ad Library website"""
+        """Search for ads, through the JSON endpoint when possible"""
+        ads = self._search_ads_api(keyword)
+        if ads is not None:
+            return ads
+        
+        if not SELENIUM_AVAILABLE:
+            self.logger.error("Search endpoint unavailable and Selenium is not installed", keyword=keyword)
+            return []
+        return self._search_ads_browser(keyword, max_scroll)
+    
+    def _search_ads_browser(self, keyword: str, max_scroll: int = 5) -> List[Dict]:
+        """Search for ads by rendering the Meta Ad Library website"""
         
         self._init_driver()
         ads = []
@@ -73,37 +225,46 @@ class MetaWebScraper(BaseCollector):
             search_url = f"{self.BASE_URL}?active_status=all&ad_type=all&country=US&q={keyword}&search_type=keyword_unordered"
             
             self.logger.info(f"Navigating to Meta Ad Library: {keyword}")
+            self._apply_rate_limit()
             self.driver.get(search_url)
             
-            # Wait for page to load
-            time.sleep(5)
+            # Wait for the first ads to render instead of a fixed delay
+            try:
+                WebDriverWait(self.driver, PAGE_LOAD_TIMEOUT).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ', '.join(AD_CONTAINER_SELECTORS)))
+                )
+            except TimeoutException:
+                self.logger.warning("No ads rendered before timeout", keyword=keyword)
             
-            # Scroll to load more ads
+            # Scroll to load more ads, stopping as soon as the page stops growing
             for scroll in range(max_scroll):
                 self.logger.info(f"Scrolling to load more ads... ({scroll + 1}/{max_scroll})")
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
+                height = self.driver.execute_script(
+                    "window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight;"
+                )
+                try:
+                    WebDriverWait(self.driver, SCROLL_TIMEOUT).until(
+                        lambda driver: driver.execute_script("return document.body.scrollHeight;") > height
+                    )
+                except TimeoutException:
+                    break
             
             # Extract ad elements
             self.logger.info("Extracting ad data from page...")
             
-            # Try to find ad containers (Meta's structure may vary)
-            ad_containers = self.driver.find_elements(By.CSS_SELECTOR, '[role="article"]')
-            
-            if not ad_containers:
-                # Try alternative selectors
-                ad_containers = self.driver.find_elements(By.CSS_SELECTOR, 'div[data-testid]')
+            # Find ad containers (Meta's structure may vary) and read them in the browser
+            page = self.driver.execute_script(EXTRACT_ADS_JS, AD_CONTAINER_SELECTORS, self.config.max_results)
             
-            self.logger.info(f"Found {len(ad_containers)} potential ad containers")
+            self.logger.info(f"Found {page['found']} potential ad containers")
             
-            for idx, container in enumerate(ad_containers[:self.config.max_results]):
-                try:
-                    ad_data = self._extract_ad_data(container, idx)
-                    if ad_data:
-                        ads.append(ad_data)
-                except Exception as e:
-                    self.logger.warning(f"Failed to extract ad {idx}: {e}")
+            # Every ad of a page is stamped with the same scrape time
+            scraped_at = datetime.utcnow().isoformat()
+            id_suffix = int(time.time())
+            for idx, extracted in enumerate(page['ads']):
+                if isinstance(extracted, str):
+                    self.logger.warning(f"Failed to extract ad {idx}: {extracted}")
                     continue
+                ads.append(self._extract_ad_data(extracted, idx, scraped_at, id_suffix))
             
             self.logger.info(f"Successfully extracted {len(ads)} ads")
             
@@ -112,77 +273,53 @@ class MetaWebScraper(BaseCollector):
         
         return ads
     
-    def _extract_ad_data(self, container, idx: int) -> Dict:
-        """Extract data from a single ad container"""
+    def _extract_ad_data(self, extracted: Dict, idx: int, scraped_at: str, id_suffix: int) -> Dict:
+        """Build the raw ad from one container's fields as read by EXTRACT_ADS_JS"""
         
         ad_data = {
-            'id': f'web_scraped_{idx}_{int(time.time())}',
-            'scraped_at': datetime.utcnow().isoformat(),
+            'id': f'web_scraped_{idx}_{id_suffix}',
+            'scraped_at': scraped_at,
         }
         
-        try:
-            # Extract text content
-            text_elements = container.find_elements(By.TAG_NAME, 'span')
-            all_text = ' '.join([elem.text for elem in text_elements if elem.text])
-            
-            # Try to identify different parts
-            paragraphs = container.find_elements(By.TAG_NAME, 'p')
-            if paragraphs:
-                ad_data['ad_creative_bodies'] = [p.text for p in paragraphs if p.text]
-            
-            # Extract links
-            links = container.find_elements(By.TAG_NAME, 'a')
-            if links:
-                ad_data['ad_snapshot_url'] = links[0].get_attribute('href') if links else ''
-            
-            # Extract images
-            images = container.find_elements(By.TAG_NAME, 'img')
-            if images:
-                ad_data['images'] = [img.get_attribute('src') for img in images if img.get_attribute('src')]
-            
-            # Store all text for processing
-            ad_data['full_text'] = all_text
-            
-            # Try to find page name / advertiser
-            try:
-                page_name_elem = container.find_element(By.CSS_SELECTOR, 'a[role="link"]')
-                ad_data['page_name'] = page_name_elem.text
-            except:
-                ad_data['page_name'] = 'Unknown'
-            
-            return ad_data
-            
-        except Exception as e:
-            self.logger.warning(f"Error extracting ad data: {e}")
-            return None
+        if extracted['bodies'] is not None:
+            ad_data['ad_creative_bodies'] = extracted['bodies']
+        if extracted['href'] is not None:
+            ad_data['ad_snapshot_url'] = extracted['href']
+        if extracted['images'] is not None:
+            ad_data['images'] = extracted['images']
+        
+        # Store all text for processing
+        ad_data['full_text'] = extracted['full_text']
+        ad_data['page_name'] = extracted['page_name'] if extracted['page_name'] is not None else 'Unknown'
+        
+        return ad_data
     
-    def collect(self) -> List[Dict]:
-        """Collect ads for all configured keywords"""
-        all_ads = []
+    def collect(self) -> Iterator[Dict]:
+        """Collect ads for all configured keywords, yielding each keyword's ads as they are scraped"""
+        collected = 0
         
         try:
             for keyword in self.config.keywords:
                 self.logger.info(f"Searching for ads with keyword: {keyword}")
                 
                 ads = self._search_ads(keyword, max_scroll=3)
-                all_ads.extend(ads)
-                
                 self.logger.info(f"Collected {len(ads)} ads for keyword: {keyword}")
                 
-                if len(all_ads) >= self.config.max_results:
-                    break
+                for ad in ads[:self.config.max_results - collected]:
+                    collected += 1
+                    yield ad
                 
-                time.sleep(2)  # Be respectful
+                if collected >= self.config.max_results:
+                    break
             
         finally:
             # Clean up
             if self.driver:
                 self.driver.quit()
+                self.driver = None
                 self.logger.info("WebDriver closed")
-        
-        return all_ads[:self.config.max_results]
     
-    def normalize(self, raw_data: Dict) -> Dict:
+    def normalize(self, raw_data: Dict, collected_at: Optional[str] = None) -> Dict:
         """Transform scraped data to standard schema"""
         
         # Extract text content
@@ -191,26 +328,75 @@ class MetaWebScraper(BaseCollector):
         body_text = raw_data.get('full_text', '')
         
         return {
+            **_STATIC_FIELDS,
             "ad_id": f"meta_web_{raw_data.get('id')}",
-            "platform": "meta_web",
             "source_url": raw_data.get('ad_snapshot_url', ''),
-            "collected_at": datetime.utcnow().isoformat(),
+            "collected_at": collected_at or datetime.utcnow().isoformat(),
             "raw_data": raw_data,
             
             # Content
             "headline": headline,
             "body_text": body_text,
-            "call_to_action": '',
             "media_urls": raw_data.get('images', []),
-            "landing_page": '',
             
             # Metadata
             "brand_name": raw_data.get('page_name', 'Unknown'),
             "page_name": raw_data.get('page_name', 'Unknown'),
-            "detected_keywords": self.config.keywords,
-            
-            # System
-            "collection_status": "success",
-            "validation_errors": [],
-            "retry_count": 0
+            "detected_keywords": self.keywords
         }
+
+
+def _parse_search_response(text: str, scraped_at: str) -> Tuple[List[Dict], Optional[str]]:
+    """Ads and forward cursor from one search endpoint response"""
+    payload = orjson.loads(text[len(JSON_GUARD):] if text.startswith(JSON_GUARD) else text)['payload']
+    
+    ads = []
+    for group in payload.get('results') or []:
+        # Results come grouped by creative; each group is a list of ads
+        for ad in group if isinstance(group, list) else [group]:
+            ads.append(_parse_search_ad(ad, scraped_at))
+    
+    return ads, payload.get('forwardCursor')
+
+
+def _parse_search_ad(ad: Dict, scraped_at: str) -> Dict:
+    """Map one search endpoint ad to the fields the Selenium path extracts"""
+    snapshot = ad.get('snapshot') or {}
+    cards = snapshot.get('cards') or []
+    
+    bodies = [_snapshot_text(snapshot.get('body'))]
+    bodies.extend(_snapshot_text(card.get('body')) for card in cards)
+    bodies = [body for body in bodies if body]
+    
+    images = []
+    for creative in [snapshot, *cards]:
+        for image in creative.get('images') or []:
+            url = image.get('original_image_url') or image.get('resized_image_url')
+            if url:
+                images.append(url)
+        for video in creative.get('videos') or []:
+            if video.get('video_preview_image_url'):
+                images.append(video['video_preview_image_url'])
+    
+    parts = [snapshot.get('title'), *bodies, snapshot.get('link_description'), snapshot.get('cta_text')]
+    ad_id = ad.get('adArchiveID') or ad.get('adid')
+    
+    ad_data = {
+        'id': ad_id,
+        'scraped_at': scraped_at,
+        'ad_snapshot_url': f"https://www.facebook.com/ads/library/?id={ad_id}",
+        'full_text': ' '.join(part for part in parts if part),
+        'page_name': ad.get('pageName') or snapshot.get('page_name') or 'Unknown',
+    }
+    if bodies:
+        ad_data['ad_creative_bodies'] = bodies
+    if images:
+        ad_data['images'] = images
+    return ad_data
+
+
+def _snapshot_text(body) -> str:
+    """Plain text of a snapshot body, which is either a string or {'markup': {'__html': ...}}"""
+    if isinstance(body, dict):
+        body = (body.get('markup') or {}).get('__html') or body.get('text') or ''
+    return ' '.join(html.unescape(HTML_TAG.sub(' ', body or '')).split())
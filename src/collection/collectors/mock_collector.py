@@ -1,16 +1,32 @@
 """Mock data collector for testing without API access"""
 
-from typing import List, Dict
-from datetime import datetime, timedelta
+from typing import Dict, Optional, Iterator
+from types import MappingProxyType
+from datetime import datetime
 import random
 import time
+import numpy as np
 from src.collection.collectors.base_collector import BaseCollector, CollectionConfig
+from src.collection.collectors._mock_kernels import mock_metrics
+
+
+# Fields that are the same for every normalized mock ad, shared rather than rebuilt per ad.
+# Empty collections are tuples so no ad can mutate another's
+_STATIC_FIELDS = MappingProxyType({
+    "platform": "mock",
+    "media_urls": (),
+    "landing_page": None,
+    "collection_status": "success",
+    "validation_errors": (),
+    "retry_count": 0
+})
 
 
 class MockAdCollector(BaseCollector):
     """
-    Enhanced mock collector that generates realistic ad data with delays
-    Simulates real web scraping behavior for testing
+    Enhanced mock collector that generates realistic ad data
+    Simulates real web scraping behavior for testing; the scraping delays
+    are only slept when config.simulate_delay is set
     """
     
     # Extended brand database with industry categories for more realistic data
@@ -34,10 +50,10 @@ class MockAdCollector(BaseCollector):
     }
     
     # Flatten brands for easy selection
-    ALL_BRANDS = [brand for brands in SAMPLE_BRANDS.values() for brand in brands]
+    ALL_BRANDS = tuple(brand for brands in SAMPLE_BRANDS.values() for brand in brands)
     
     # Realistic ad headlines by category
-    SAMPLE_HEADLINES = [
+    SAMPLE_HEADLINES = (
         # Sales & Promotions
         "Flash Sale - Up to 70% Off Everything",
         "Summer Clearance - Save Big Today",
@@ -113,10 +129,10 @@ class MockAdCollector(BaseCollector):
         "Make Every Day Better",
         "Level Up Your Game",
         "Unlock Your Full Potential"
-    ]
+    )
     
     # Realistic ad body text - more detailed and varied
-    SAMPLE_BODY_TEXT = [
+    SAMPLE_BODY_TEXT = (
         "Experience unmatched quality and style with our latest collection. Premium materials, expert craftsmanship, and designs that stand out. Shop now and elevate your lifestyle with products built to last.",
         "Transform the way you live, work, and play. Our innovative products are designed with you in mind, combining cutting-edge technology with user-friendly features. Free shipping on all orders over $50.",
         "Don't miss out on this limited-time opportunity to save big on your favorite products. Join millions of satisfied customers worldwide who trust us for quality, value, and exceptional service.",
@@ -142,141 +158,215 @@ class MockAdCollector(BaseCollector):
         "Certified by industry leaders and trusted by professionals worldwide. When only the best will do, choose the brand that delivers exceptional results every single time.",
         "From casual everyday use to professional applications, our versatile products adapt to your needs. One solution, endless possibilities. Find out why we're the preferred choice.",
         "Revolutionary technology meets classic design. Experience innovation that changes the game while maintaining the timeless appeal you love. Available now in multiple colors and sizes."
-    ]
+    )
     
     # Call-to-action variations
-    SAMPLE_CTA = [
+    SAMPLE_CTA = (
         "Shop Now", "Learn More", "Sign Up Today", "Get Started", "Buy Now",
         "Order Now", "Claim Offer", "Join Free", "Download Now", "Try Free",
         "Get Yours", "Reserve Now", "See Details", "Explore More", "Book Now",
         "Subscribe", "View Collection", "Start Shopping", "Discover More"
-    ]
+    )
     
     def __init__(self, config: CollectionConfig):
         super().__init__(config)
+        # A seeded collector owns its generator, so its ads don't depend on other
+        # users of the random module; unseeded ones keep following random.seed()
+        self._random = random.Random(config.seed) if config.seed is not None else random
         self.logger.info("Using Enhanced MockAdCollector - simulating realistic web scraping")
     
-    def collect(self) -> List[Dict]:
-        """Generate realistic mock ad data with simulated scraping delays"""
-        all_ads = []
+    # Industry of each brand, one hashed lookup per ad. Categories are walked in
+    # reverse so a brand listed twice (Amazon) keeps its first category
+    BRAND_INDUSTRY = {
+        brand: industry
+        for industry, brands in reversed(SAMPLE_BRANDS.items())
+        for brand in brands
+    }
+    
+    LINK_TITLE_SUFFIXES = ('Store', 'Site', 'Shop', 'Website')
+    FUNDING_SUFFIXES = ('Inc.', 'LLC', 'Corp.', 'Ltd.')
+    PAGE_SUFFIXES = ('Official', 'Global', 'USA', 'Store', '')
+    CURRENCIES = ("USD", "EUR", "GBP")
+    CURRENCY_WEIGHTS = (60, 20, 20)  # Percent of ads in each currency
+    # Options that end up inside the ads are tuples too, since every ad
+    # drawing the same option shares the one object
+    PUBLISHER_PLATFORMS = (
+        ("facebook",),
+        ("instagram",),
+        ("facebook", "instagram"),
+        ("messenger",),
+        ("audience_network",),
+        ("facebook", "instagram", "messenger")
+    )
+    DELIVERY_OPTIMIZATIONS = (
+        "link_clicks", "impressions", "reach", "conversions",
+        "landing_page_views", "post_engagement", "video_views"
+    )
+    AGE_MIN = (18, 25, 35, 45)
+    AGE_MAX = (24, 34, 44, 54, 65)
+    GENDERS = ("All", "Men", "Women")
+    REGIONS = (
+        ("United States",),
+        ("United States", "Canada"),
+        ("United States", "United Kingdom", "Australia"),
+        ("Worldwide",)
+    )
+    
+    def collect(self) -> Iterator[Dict]:
+        """
+        Generate realistic mock ad data, with simulated scraping delays if configured
+        Ads are yielded as they are generated, so downstream stages overlap the delays
+        Every random field is drawn for the whole batch up front, one column at a time
+        """
         num_ads = min(self.config.max_results, 100)  # Support up to 100 ads
         
         self.logger.info(f"Starting simulated scraping for {num_ads} ads...")
         
-        for i in range(num_ads):
-            # Simulate realistic scraping delay (0.8-2.5 seconds per ad - more realistic)
-            delay = random.uniform(0.8, 2.5)
-            time.sleep(delay)
+        # NumPy columns are seeded from the same source as the choices
+        rng = np.random.default_rng(self._random.getrandbits(64))
+        choices = self._random.choices
+        now = datetime.now()
+        
+        # Simulate realistic scraping delay (0.8-2.5 seconds per ad - more realistic).
+        # Drawn even when not slept, so a seed gives the same ads either way
+        delays = rng.uniform(0.8, 2.5, num_ads).tolist()
+        simulate_delay = self.config.simulate_delay
+        
+        # Select brands and determine industries
+        brands = choices(self.ALL_BRANDS, k=num_ads)
+        brand_industry = self.BRAND_INDUSTRY.get
+        industries = [brand_industry(brand, "Other") for brand in brands]
+        
+        # Generate highly realistic engagement metrics based on spend
+        # Higher spend = more impressions (realistic correlation)
+        spend_lower = rng.integers(500, 5001, num_ads)
+        spend_upper = spend_lower + rng.integers(2000, 15001, num_ads)
+        
+        # Calculate impressions based on average CPM ($5-$20)
+        cpm = rng.uniform(5, 20, num_ads)
+        impressions_low_factor = rng.uniform(0.7, 0.9, num_ads)
+        impressions_high_factor = rng.uniform(1.1, 1.5, num_ads)
+        
+        # Randomly decide if ad is still active (70% active)
+        start_offsets = rng.integers(1, 91, num_ads)
+        is_active = rng.random(num_ads) < 0.70
+        run_lengths = rng.integers(7, 61, num_ads)
+        
+        # Dates as datetime64 columns, formatted like datetime.isoformat()
+        start_dates = np.datetime64(now, 'us') - start_offsets.astype('timedelta64[D]')
+        stop_dates = start_dates + run_lengths.astype('timedelta64[D]')
+        iso_unit = 'us' if now.microsecond else 's'
+        start_times = np.datetime_as_string(start_dates, unit=iso_unit).tolist()
+        stop_times = np.where(is_active, None, np.datetime_as_string(stop_dates, unit=iso_unit)).tolist()
+        
+        # Generate realistic CTR and engagement
+        ctr = rng.uniform(0.5, 5.0, num_ads)  # Click-through rate percentage
+        conversion_factor = rng.uniform(0.01, 0.15, num_ads)  # 1-15% conversion rate
+        
+        # Every engagement metric follows from the draws in one kernel call
+        impressions_lower, impressions_upper, clicks, conversions, cpc, conversion_rate = mock_metrics(
+            spend_lower, spend_upper, cpm, impressions_low_factor,
+            impressions_high_factor, ctr, conversion_factor
+        )
+        
+        # Make headlines and content more brand-relevant
+        headlines = choices(self.SAMPLE_HEADLINES, k=num_ads)
+        bodies = choices(self.SAMPLE_BODY_TEXT, k=num_ads)
+        
+        # Add brand name naturally to some ads
+        branded = (rng.random(num_ads) < 0.4).tolist()
+        
+        # Generate realistic ad IDs based on platform format
+        # Facebook/Meta: 17-19 digit numeric IDs
+        # Google Ads: mix of numbers and letters
+        ad_id_formats = [
+            rng.integers(100000000000000000, 999999999999999999, num_ads, endpoint=True).astype(str),  # Facebook/Meta format (18 digits)
+            rng.integers(10000000000000000, 99999999999999999, num_ads, endpoint=True).astype(str),   # Facebook/Meta format (17 digits)
+            np.char.add(  # Google Ads format
+                np.char.add('gad_', rng.integers(1000000000, 9999999999, num_ads, endpoint=True).astype(str)),
+                np.char.add('_', rng.integers(100000, 999999, num_ads, endpoint=True).astype(str))
+            ),
+            rng.integers(1000000000000, 9999999999999, num_ads, endpoint=True).astype(str),  # LinkedIn/Twitter format (13 digits)
+        ]
+        ad_ids = np.choose(rng.integers(0, len(ad_id_formats), num_ads), ad_id_formats).tolist()
+        
+        columns = zip(
+            delays, brands, industries, ad_ids, headlines, bodies, branded,
+            choices(self.SAMPLE_CTA, k=num_ads),
+            choices(self.LINK_TITLE_SUFFIXES, k=num_ads),
+            start_times, stop_times,
+            rng.integers(100000000000, 999999999999, num_ads, endpoint=True).tolist(),
+            choices(self.FUNDING_SUFFIXES, k=num_ads),
+            choices(self.PAGE_SUFFIXES, k=num_ads),
+            rng.integers(1000000000, 9999999999, num_ads, endpoint=True).tolist(),
+            impressions_lower.tolist(), impressions_upper.tolist(),
+            spend_lower.tolist(), spend_upper.tolist(),
+            choices(self.CURRENCIES, weights=self.CURRENCY_WEIGHTS, k=num_ads),
+            choices(self.PUBLISHER_PLATFORMS, k=num_ads),
+            rng.integers(500000, 2000000, num_ads, endpoint=True).tolist(),
+            rng.integers(2000000, 15000000, num_ads, endpoint=True).tolist(),
+            choices(self.DELIVERY_OPTIMIZATIONS, k=num_ads),
+            choices(self.AGE_MIN, k=num_ads), choices(self.AGE_MAX, k=num_ads),
+            choices(self.GENDERS, k=num_ads),
+            choices(self.REGIONS, k=num_ads),
+            clicks.tolist(), conversions.tolist(), np.round(ctr, 2).tolist(),
+            cpc.tolist(), conversion_rate.tolist(),
+        )
+        
+        for i, (delay, brand, industry, ad_id, headline, body, is_branded, cta, link_suffix,
+                start_time, stop_time, snapshot_id, funding_suffix, page_suffix,
+                page_id, imp_lower, imp_upper, spend_low, spend_high, currency, platforms,
+                audience_lower, audience_upper, optimization, age_min, age_max, gender,
+                regions, ad_clicks, ad_conversions, ad_ctr, ad_cpc, ad_conversion_rate) in enumerate(columns):
+            if simulate_delay:
+                time.sleep(delay)
             
             if (i + 1) % 5 == 0:
                 self.logger.info(f"Scraped {i + 1}/{num_ads} ads... ({int((i+1)/num_ads*100)}% complete)")
             
-            # Select brand and determine industry
-            brand = random.choice(self.ALL_BRANDS)
-            industry = next((k for k, v in self.SAMPLE_BRANDS.items() if brand in v), "Other")
-            
-            # Generate highly realistic engagement metrics based on spend
-            # Higher spend = more impressions (realistic correlation)
-            spend_lower = random.randint(500, 5000)
-            spend_upper = spend_lower + random.randint(2000, 15000)
-            
-            # Calculate impressions based on average CPM ($5-$20)
-            avg_spend = (spend_lower + spend_upper) / 2
-            cpm = random.uniform(5, 20)
-            estimated_impressions = int((avg_spend / cpm) * 1000)
-            
-            impressions_lower = int(estimated_impressions * random.uniform(0.7, 0.9))
-            impressions_upper = int(estimated_impressions * random.uniform(1.1, 1.5))
-            
-            # Randomly decide if ad is still active (70% active)
-            start_date = datetime.now() - timedelta(days=random.randint(1, 90))
-            is_active = random.random() < 0.70
-            stop_date = None if is_active else start_date + timedelta(days=random.randint(7, 60))
-            
-            # Generate realistic CTR and engagement
-            ctr = random.uniform(0.5, 5.0)  # Click-through rate percentage
-            clicks = int((impressions_lower + impressions_upper) / 2 * ctr / 100)
-            conversions = int(clicks * random.uniform(0.01, 0.15))  # 1-15% conversion rate
-            
-            # Make headlines and content more brand-relevant
-            headline = random.choice(self.SAMPLE_HEADLINES)
-            body = random.choice(self.SAMPLE_BODY_TEXT)
-            
-            # Add brand name naturally to some ads
-            if random.random() < 0.4:
-                headline = f"{brand}: {headline}"
-            
-            # Generate realistic ad ID based on platform format
-            # Facebook/Meta: 17-19 digit numeric IDs
-            # Google Ads: mix of numbers and letters
-            ad_id_format = random.choice([
-                f"{random.randint(100000000000000000, 999999999999999999)}",  # Facebook/Meta format (18 digits)
-                f"{random.randint(10000000000000000, 99999999999999999)}",   # Facebook/Meta format (17 digits)
-                f"gad_{random.randint(1000000000, 9999999999)}_{random.randint(100000, 999999)}",  # Google Ads format
-                f"{random.randint(1000000000000, 9999999999999)}",  # LinkedIn/Twitter format (13 digits)
-            ])
-            
-            ad = {
-                "id": ad_id_format,
-                "ad_creative_bodies": [headline],
+            yield {
+                "id": ad_id,
+                "ad_creative_bodies": [f"{brand}: {headline}" if is_branded else headline],
                 "ad_creative_link_descriptions": [body],
-                "ad_creative_link_captions": [random.choice(self.SAMPLE_CTA)],
-                "ad_creative_link_titles": [f"{brand} - Official {random.choice(['Store', 'Site', 'Shop', 'Website'])}"],
+                "ad_creative_link_captions": [cta],
+                "ad_creative_link_titles": [f"{brand} - Official {link_suffix}"],
                 "industry": industry,
-                "ad_delivery_start_time": start_date.isoformat(),
-                "ad_delivery_stop_time": stop_date.isoformat() if stop_date else None,
-                "ad_snapshot_url": f"https://facebook.com/ads/library/?id={random.randint(100000000000, 999999999999)}",
-                "currency": "USD",
-                "funding_entity": f"{brand} {random.choice(['Inc.', 'LLC', 'Corp.', 'Ltd.'])}",
-                "page_name": f"{brand} {random.choice(['Official', 'Global', 'USA', 'Store', ''])}".strip(),
-                "page_id": random.randint(1000000000, 9999999999),
+                "ad_delivery_start_time": start_time,
+                "ad_delivery_stop_time": stop_time,
+                "ad_snapshot_url": f"https://facebook.com/ads/library/?id={snapshot_id}",
+                "currency": currency,
+                "funding_entity": f"{brand} {funding_suffix}",
+                "page_name": f"{brand} {page_suffix}".strip(),
+                "page_id": page_id,
                 "impressions": {
-                    "lower_bound": impressions_lower,
-                    "upper_bound": impressions_upper
+                    "lower_bound": imp_lower,
+                    "upper_bound": imp_upper
                 },
                 "spend": {
-                    "lower_bound": spend_lower,
-                    "upper_bound": spend_upper
+                    "lower_bound": spend_low,
+                    "upper_bound": spend_high
                 },
-                "currency": random.choice(["USD", "USD", "USD", "EUR", "GBP"]),  # 60% USD
                 # Additional realistic fields
-                "publisher_platforms": random.choice([
-                    ["facebook"], 
-                    ["instagram"], 
-                    ["facebook", "instagram"],
-                    ["messenger"], 
-                    ["audience_network"],
-                    ["facebook", "instagram", "messenger"]
-                ]),
+                "publisher_platforms": platforms,
                 "estimated_audience_size": {
-                    "lower_bound": random.randint(500000, 2000000),
-                    "upper_bound": random.randint(2000000, 15000000)
+                    "lower_bound": audience_lower,
+                    "upper_bound": audience_upper
                 },
-                "ad_delivery_optimization": random.choice([
-                    "link_clicks", "impressions", "reach", "conversions",
-                    "landing_page_views", "post_engagement", "video_views"
-                ]),
-                "target_age": f"{random.choice([18, 25, 35, 45])}-{random.choice([24, 34, 44, 54, 65])}",
-                "target_gender": random.choice(["All", "Men", "Women"]),
-                "regions": random.choice([
-                    ["United States"], 
-                    ["United States", "Canada"],
-                    ["United States", "United Kingdom", "Australia"],
-                    ["Worldwide"]
-                ]),
+                "ad_delivery_optimization": optimization,
+                "target_age": f"{age_min}-{age_max}",
+                "target_gender": gender,
+                "regions": regions,
                 # Realistic engagement metrics
-                "clicks": clicks,
-                "conversions": conversions,
-                "ctr": round(ctr, 2),
-                "cpc": round((spend_lower + spend_upper) / 2 / clicks if clicks > 0 else 0, 2),
-                "conversion_rate": round(conversions / clicks * 100 if clicks > 0 else 0, 2)
+                "clicks": ad_clicks,
+                "conversions": ad_conversions,
+                "ctr": ad_ctr,
+                "cpc": ad_cpc,
+                "conversion_rate": ad_conversion_rate
             }
-            all_ads.append(ad)
             
-        self.logger.info(f"✓ Successfully scraped {len(all_ads)} ads (simulated)")
-        return all_ads
+        self.logger.info(f"✓ Successfully scraped {num_ads} ads (simulated)")
     
-    def normalize(self, raw_data: Dict) -> Dict:
+    def normalize(self, raw_data: Dict, collected_at: Optional[str] = None) -> Dict:
         """Transform mock data to standard schema"""
         
         ad_bodies = raw_data.get('ad_creative_bodies', [])
@@ -303,33 +393,26 @@ class MockAdCollector(BaseCollector):
             }
         
         return {
+            **_STATIC_FIELDS,
             "ad_id": raw_data.get('id'),  # Use realistic platform-style IDs directly
-            "platform": "mock",
             "source_url": raw_data.get('ad_snapshot_url'),
-            "collected_at": datetime.utcnow().isoformat(),
+            "collected_at": collected_at or datetime.utcnow().isoformat(),
             "raw_data": raw_data,
             
             # Content
             "headline": headline,
             "body_text": body_text,
             "call_to_action": call_to_action,
-            "media_urls": [],
-            "landing_page": None,
             
             # Metadata
             "brand_name": raw_data.get('page_name'),
             "page_name": raw_data.get('page_name'),
             "funding_entity": raw_data.get('funding_entity'),
-            "detected_keywords": self.config.keywords,
+            "detected_keywords": self.keywords,
             "start_date": raw_data.get('ad_delivery_start_time'),
             "end_date": raw_data.get('ad_delivery_stop_time'),
             
             # Engagement
             "impressions": impressions,
-            "spend_range": spend_range,
-            
-            # System
-            "collection_status": "success",
-            "validation_errors": [],
-            "retry_count": 0
+            "spend_range": spend_range
         }
@@ -2,13 +2,54 @@
 
 import scrapy
 from scrapy.crawler import CrawlerProcess
-from bs4 import BeautifulSoup
-import time
-from typing import List, Dict
+from lxml import etree, html as lxml_html
+import hashlib
+from typing import List, Dict, Optional
+from types import MappingProxyType
 from datetime import datetime
 from src.collection.collectors.base_collector import BaseCollector, CollectionConfig
 
 
+# Compiled once. One pass over the page matching any of the CSS selectors
+# div[class*="promo"], div[class*="banner"], div[class*="advertisement"],
+# div[id*="ad-"] and section[class*="campaign"], in document order
+XPATH_AD_CONTAINERS = etree.XPath(
+    "//div[contains(@class, 'promo') or contains(@class, 'banner')"
+    " or contains(@class, 'advertisement') or contains(@id, 'ad-')]"
+    " | //section[contains(@class, 'campaign')]"
+)
+XPATH_HEADING = etree.XPath("(.//h1 | .//h2 | .//h3)[1]")  # First h1-h3 in document order
+XPATH_TEXT = etree.XPath(".//text()[not(ancestor::script or ancestor::style)]", smart_strings=False)
+XPATH_IMAGE_SRCS = etree.XPath(".//img/@src", smart_strings=False)
+XPATH_LINK_HREFS = etree.XPath(".//a/@href", smart_strings=False)
+
+
+def _element_text(element) -> str:
+    """Text of an element with each string stripped, like BeautifulSoup's get_text(strip=True)"""
+    return ''.join(text.strip() for text in XPATH_TEXT(element))
+
+
+def _content_digest(raw_data: Dict) -> str:
+    """
+    Stable id for a scraped element: the same page and content give the same
+    digest in every run, unlike hash() (salted per process) plus a timestamp
+    """
+    key = '\x1f'.join(
+        raw_data.get(field) or '' for field in ('source_url', 'headline', 'body_text')
+    )
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+# Fields that are the same for every normalized scraped web ad, shared rather than rebuilt per ad.
+# Empty collections are tuples so no ad can mutate another's
+_STATIC_FIELDS = MappingProxyType({
+    "platform": "web",
+    "collection_status": "success",
+    "validation_errors": (),
+    "retry_count": 0
+})
+
+
 class CompetitorAdSpider(scrapy.Spider):
     """
     Scrapes competitor websites for ad-related content
@@ -31,28 +72,19 @@ class CompetitorAdSpider(scrapy.Spider):
     def parse(self, response):
         """Extract ad content from competitor pages"""
         
-        soup = BeautifulSoup(response.text, 'lxml')
-        
-        ad_selectors = [
-            'div[class*="promo"]',
-            'div[class*="banner"]',
-            'div[class*="advertisement"]',
-            'div[id*="ad-"]',
-            'section[class*="campaign"]'
-        ]
+        tree = lxml_html.document_fromstring(response.text)
         
-        for selector in ad_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                ad_data = {
-                    'headline': element.find(['h1', 'h2', 'h3']).get_text(strip=True) if element.find(['h1', 'h2', 'h3']) else None,
-                    'body_text': element.get_text(strip=True),
-                    'images': [img.get('src') for img in element.find_all('img') if img.get('src')],
-                    'links': [a.get('href') for a in element.find_all('a') if a.get('href')],
-                    'source_url': response.url
-                }
-                self.collected_ads.append(ad_data)
-                yield ad_data
+        # An element matching several selectors is now reported once
+        for element in XPATH_AD_CONTAINERS(tree):
+            ad_data = {
+                'headline': _element_text(heading[0]) if (heading := XPATH_HEADING(element)) else None,
+                'body_text': _element_text(element),
+                'images': [src for src in XPATH_IMAGE_SRCS(element) if src],
+                'links': [href for href in XPATH_LINK_HREFS(element) if href],
+                'source_url': response.url
+            }
+            self.collected_ads.append(ad_data)
+            yield ad_data
 
 
 class WebScraperCollector(BaseCollector):
@@ -75,22 +107,18 @@ class WebScraperCollector(BaseCollector):
         
         return spider.collected_ads
     
-    def normalize(self, raw_data: Dict) -> Dict:
+    def normalize(self, raw_data: Dict, collected_at: Optional[str] = None) -> Dict:
         """Transform scraped web data to standard schema"""
         
         return {
-            "ad_id": f"web_{hash(raw_data.get('source_url'))}_{int(time.time())}",
-            "platform": "web",
+            **_STATIC_FIELDS,
+            "ad_id": f"web_{_content_digest(raw_data)}",
             "source_url": raw_data.get('source_url'),
-            "collected_at": datetime.utcnow().isoformat(),
+            "collected_at": collected_at or datetime.utcnow().isoformat(),
             "raw_data": raw_data,
             
             "headline": raw_data.get('headline'),
             "body_text": raw_data.get('body_text'),
             "media_urls": raw_data.get('images', []),
-            "landing_page": raw_data.get('links', [None])[0],
-            
-            "collection_status": "success",
-            "validation_errors": [],
-            "retry_count": 0
+            "landing_page": links[0] if (links := raw_data.get('links')) else None
         }
@@ -0,0 +1,48 @@
+"""TTL cache for collector page fetches"""
+
+import functools
+import hashlib
+import threading
+from typing import Any
+import orjson
+from cachetools import TTLCache
+
+
+def _worth_caching(result: Any) -> bool:
+    """Only keep pages that returned ads - empty pages are usually errors"""
+    if isinstance(result, dict):
+        return bool(result.get('data'))
+    return bool(result)
+
+
+def memoize_page(key_prefix: str, ttl: int = 3600, maxsize: int = 1024):
+    """
+    Cache an async page fetch by its arguments for ttl seconds
+    Pages are stored serialized, so every hit returns fresh objects that
+    callers may mutate. Pass force_refresh=True to skip the cache lookup
+    """
+    def decorator(fetch):
+        pages: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        lock = threading.Lock()  # Shared collectors run on several threads
+
+        @functools.wraps(fetch)
+        async def wrapper(self, *args, force_refresh: bool = False, **kwargs):
+            args_key = orjson.dumps([args, kwargs], option=orjson.OPT_SORT_KEYS)
+            key = f"{key_prefix}:{hashlib.blake2b(args_key, digest_size=16).hexdigest()}"
+
+            if not force_refresh:
+                with lock:
+                    cached = pages.get(key)
+                if cached is not None:
+                    return orjson.loads(cached)
+
+            result = await fetch(self, *args, **kwargs)
+
+            if _worth_caching(result):
+                with lock:
+                    pages[key] = orjson.dumps(result)
+            return result
+
+        wrapper.cache_clear = pages.clear
+        return wrapper
+    return decorator
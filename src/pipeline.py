@@ -0,0 +1,134 @@
+"""Streaming pipeline orchestrator for collection, preprocessing and classification"""
+
+import queue
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+import structlog
+from src.collection.collectors.base_collector import BaseCollector
+from src.preprocessing.pipeline import PreprocessingPipeline
+from src.classification.pipeline import ClassificationPipeline
+from src.workers import WORKERS
+
+logger = structlog.get_logger()
+
+_DONE = object()
+
+
+class StreamingPipeline:
+    """
+    Runs collection -> preprocessing -> classification as overlapping stages
+    Ads flow through bounded queues, so preprocessing starts on the first
+    collected ad instead of waiting for the whole collection to finish
+    """
+
+    def __init__(
+        self,
+        preprocessing: PreprocessingPipeline,
+        classification: ClassificationPipeline,
+        preprocess_workers: int = WORKERS,
+        classify_workers: int = 1,
+        queue_size: int = 64
+    ):
+        self.preprocessing = preprocessing
+        self.classification = classification
+        self.preprocess_workers = max(1, preprocess_workers)
+        self.classify_workers = max(1, classify_workers)
+        self.queue_size = queue_size
+
+    def run(
+        self,
+        collector: BaseCollector,
+        on_event: Optional[Callable[[str, Dict], None]] = None
+    ) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """
+        Stream ads from the collector through preprocessing and classification
+        on_event, if given, is called from the stage threads with
+        ('collected', raw_ad) and ('classified', classified_ad) as ads complete
+        Returns: (raw_ads, preprocessed_ads, classified_ads)
+        """
+        emit = on_event or _ignore_event
+
+        preprocess_queue = queue.Queue(maxsize=self.queue_size)
+        classify_queue = queue.Queue(maxsize=self.queue_size)
+
+        raw_ads = []
+        preprocessed_ads = []
+        classified_ads = []
+        errors = []
+
+        def collect_stage():
+            try:
+                for ad in collector.stream():
+                    raw_ads.append(ad)
+                    emit('collected', ad)
+                    preprocess_queue.put(ad)
+            except Exception as e:
+                logger.error("Collection stage failed", error=str(e))
+                errors.append(e)
+
+        def preprocess_stage():
+            while True:
+                ad = preprocess_queue.get()
+                if ad is _DONE:
+                    return
+                result = self.preprocessing.preprocess_single(ad)
+                preprocessed_ads.append(result)
+                classify_queue.put(result)
+
+        def classify_stage():
+            while True:
+                ad = classify_queue.get()
+                if ad is _DONE:
+                    return
+                try:
+                    result = self.classification.classify(ad)
+                except Exception as e:
+                    logger.error("Batch classification failed",
+                                ad_id=ad.get('ad_id'),
+                                error=str(e))
+                    continue
+                classified_ads.append(result)
+                emit('classified', result)
+
+        collector_thread = _start(collect_stage, "collect")
+        preprocess_threads = [
+            _start(preprocess_stage, f"preprocess-{i}")
+            for i in range(self.preprocess_workers)
+        ]
+        classify_threads = [
+            _start(classify_stage, f"classify-{i}")
+            for i in range(self.classify_workers)
+        ]
+
+        # Drain the stages in order: each one is told to stop only once its
+        # upstream stage has finished producing
+        collector_thread.join()
+        _close(preprocess_queue, preprocess_threads)
+        _close(classify_queue, classify_threads)
+
+        if errors:
+            raise errors[0]
+
+        logger.info("Streaming pipeline complete",
+                   collected=len(raw_ads),
+                   preprocessed=len(preprocessed_ads),
+                   classified=len(classified_ads))
+
+        return raw_ads, preprocessed_ads, classified_ads
+
+
+def _ignore_event(stage: str, ad: Dict):
+    pass
+
+
+def _start(target, name: str) -> threading.Thread:
+    thread = threading.Thread(target=target, name=f"pipeline-{name}", daemon=True)
+    thread.start()
+    return thread
+
+
+def _close(stage_queue: queue.Queue, threads: List[threading.Thread]):
+    for _ in threads:
+        stage_queue.put(_DONE)
+    for thread in threads:
+        thread.join()
@@ -6,6 +6,12 @@ try:
 except ImportError:
     TESSERACT_AVAILABLE = False
 
+try:
+    import tesserocr  # Tesseract API bindings; a handle stays loaded between images
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 try:
     import easyocr
     EASYOCR_AVAILABLE = True
@@ -18,15 +24,70 @@ try:
 except ImportError:
     CV2_AVAILABLE = False
 
+import asyncio
+from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor
+import threading
 from PIL import Image
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import BytesIO
 import numpy as np
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 import structlog
+from cachetools import LRUCache
 
 logger = structlog.get_logger()
 
+# Preprocessing parameters: non-local means strength for the grayscale image,
+# then the neighbourhood size and offset of the adaptive threshold
+DENOISE_STRENGTH = 10
+THRESHOLD_BLOCK_SIZE = 11
+THRESHOLD_C = 2
+# Grayscale standard deviation above which an image is clean enough to OCR as is
+HIGH_CONTRAST_STD = 60
+
+# Longest image edge handed to OCR; larger creatives are downscaled first
+MAX_IMAGE_EDGE = 1600
+
+# Image downloads share one keep-alive pool; transient failures are retried by urllib3
+POOL_CONNECTIONS = 16
+POOL_SIZE = 32
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# OCR results kept by image URL; ad creatives repeat across keywords and runs
+OCR_CACHE_SIZE = 10_000
+
+# batch_extract threads; more than the cores, since downloads dominate
+BATCH_WORKERS = 8
+# Images an async batch downloads or holds decoded at once
+IMAGES_IN_FLIGHT = 16
+# Text regions (and images, when batched) per EasyOCR forward pass
+EASYOCR_BATCH_SIZE = 8
+
+
+def _easyocr_result(detections: list) -> Dict:
+    """Combine EasyOCR (bbox, text, confidence) detections into an OCR result"""
+    text_parts = []
+    confidences = []
+    
+    for (bbox, text, confidence) in detections:
+        text_parts.append(text)
+        confidences.append(confidence)
+    
+    combined_text = ' '.join(text_parts)
+    avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+    
+    return {
+        'text': combined_text.strip(),
+        'confidence': avg_confidence,
+        'engine': 'easyocr',
+        'success': True,
+        'detected_regions': len(detections)
+    }
+
 
 class OCREngine:
     """
@@ -42,7 +103,24 @@ class OCREngine:
             primary_engine: 'tesseract' or 'easyocr'
             fallback: If True, try alternate engine if primary fails
         """
-        if not TESSERACT_AVAILABLE and not EASYOCR_AVAILABLE:
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=RETRY_STATUSES)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': 'AdIntelligence/1.0',
+            'Connection': 'keep-alive'
+        })
+        
+        # Successful results only, so a failed download is retried next time
+        self._results: LRUCache = LRUCache(maxsize=OCR_CACHE_SIZE)
+        self._results_lock = threading.Lock()
+        
+        if not (TESSERACT_AVAILABLE or TESSEROCR_AVAILABLE) and not EASYOCR_AVAILABLE:
             logger.warning("No OCR engines available. OCR functionality disabled.")
             self.primary_engine = None
             self.fallback = False
@@ -51,50 +129,95 @@ class OCREngine:
         self.primary_engine = primary_engine
         self.fallback = fallback
         self._easyocr_reader = None
+        self._easyocr_lock = threading.Lock()
         self.tesseract_config = '--oem 3 --psm 6'
+        self._tesseract_handles = threading.local()  # One tesserocr API per thread
     
     @property
     def easyocr_reader(self):
         """Lazy initialize EasyOCR to save memory"""
         if self._easyocr_reader is None:
-            self._easyocr_reader = easyocr.Reader(['en'], gpu=False)
+            with self._easyocr_lock:  # Batch threads must not each load the model
+                if self._easyocr_reader is None:
+                    self._easyocr_reader = easyocr.Reader(['en'], gpu=False)
         return self._easyocr_reader
     
+    @property
+    def tesseract_api(self):
+        """
+        This thread's tesserocr handle, created on first use and kept, so the
+        language model loads once per thread instead of once per image
+        """
+        api = getattr(self._tesseract_handles, 'api', None)
+        if api is None:
+            # Same settings as tesseract_config: --oem 3 --psm 6
+            api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.DEFAULT)
+            self._tesseract_handles.api = api
+        return api
+    
     def preprocess_image(self, image: np.ndarray) -> np.ndarray:
-        """Preprocess image for better OCR accuracy"""
+        """
+        Preprocess image for better OCR accuracy
+        Denoising runs on the grayscale image, where there is noise to remove,
+        before it is binarized. High-contrast images (most rendered ad text)
+        skip both: Tesseract binarizes them well on its own
+        """
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
             gray = image
         
-        thresh = cv2.adaptiveThreshold(
-            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+        _, std = cv2.meanStdDev(gray)
+        if std[0, 0] > HIGH_CONTRAST_STD:
+            return gray
+        
+        denoised = cv2.fastNlMeansDenoising(
+            gray, h=DENOISE_STRENGTH, templateWindowSize=7, searchWindowSize=21
         )
         
-        denoised = cv2.fastNlMeansDenoising(thresh)
-        return denoised
+        return cv2.adaptiveThreshold(
+            denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,
+            THRESHOLD_BLOCK_SIZE, THRESHOLD_C
+        )
+    
+    def _load_image(self, image_url: str) -> np.ndarray:
+        """Download and decode an image once, as the BGR array both engines take"""
+        response = self.session.get(image_url, timeout=10)
+        return self._decode_image(response.content)
+    
+    def _decode_image(self, content: bytes) -> np.ndarray:
+        """
+        Decode downloaded image bytes straight to a BGR array with OpenCV, capped
+        at MAX_IMAGE_EDGE. PIL is only used for formats this OpenCV build cannot read (e.g. GIF)
+        """
+        image = cv2.imdecode(np.frombuffer(content, np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            image = cv2.cvtColor(np.asarray(Image.open(BytesIO(content)).convert('RGB')), cv2.COLOR_RGB2BGR)
+        
+        return self._cap_size(image)
+    
+    def _cap_size(self, image: np.ndarray, max_edge: int = MAX_IMAGE_EDGE) -> np.ndarray:
+        """
+        Shrink images whose long edge exceeds max_edge; OCR and preprocessing
+        cost grows with pixel count, while ad text stays legible at this size
+        """
+        height, width = image.shape[:2]
+        scale = max_edge / max(height, width)
+        if scale >= 1:
+            return image
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
     
-    def extract_text_tesseract(self, image_url: str) -> Dict:
-        """Extract text using Tesseract OCR"""
+    def extract_text_tesseract(self, cv_image: np.ndarray) -> Dict:
+        """Extract text from a BGR image using Tesseract OCR"""
         try:
-            response = requests.get(image_url, timeout=10)
-            image = Image.open(BytesIO(response.content))
-            
-            cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
             preprocessed = self.preprocess_image(cv_image)
             
-            text = pytesseract.image_to_string(
-                Image.fromarray(preprocessed),
-                config=self.tesseract_config
-            )
-            
-            data = pytesseract.image_to_data(
-                Image.fromarray(preprocessed),
-                output_type=pytesseract.Output.DICT,
-                config=self.tesseract_config
-            )
+            if TESSEROCR_AVAILABLE:
+                text, confidences = self._read_tesserocr(preprocessed)
+            else:
+                text, confidences = self._read_pytesseract(preprocessed)
             
-            confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
             avg_confidence = sum(confidences) / len(confidences) if confidences else 0
             
             return {
@@ -105,7 +228,7 @@ class OCREngine:
             }
             
         except Exception as e:
-            logger.error("Tesseract OCR failed", url=image_url, error=str(e))
+            logger.error("Tesseract OCR failed", error=str(e))
             return {
                 'text': '',
                 'confidence': 0,
@@ -114,35 +237,41 @@ class OCREngine:
                 'error': str(e)
             }
     
-    def extract_text_easyocr(self, image_url: str) -> Dict:
-        """Extract text using EasyOCR"""
+    def _read_tesserocr(self, preprocessed: np.ndarray) -> Tuple[str, List[int]]:
+        """Text and positive word confidences from this thread's loaded Tesseract API"""
+        api = self.tesseract_api
+        api.SetImage(Image.fromarray(preprocessed))
+        text = api.GetUTF8Text()
+        return text, [conf for conf in api.AllWordConfidences() if conf > 0]
+    
+    def _read_pytesseract(self, preprocessed: np.ndarray) -> Tuple[str, List[int]]:
+        """Text and positive word confidences from one tesseract run via pytesseract"""
+        # One Tesseract run gives both the words and their confidences
+        data = pytesseract.image_to_data(
+            Image.fromarray(preprocessed),
+            output_type=pytesseract.Output.DICT,
+            config=self.tesseract_config
+        )
+        
+        # Rebuild the text line by line, as image_to_string would
+        lines = {}
+        for word, block, paragraph, line in zip(
+            data['text'], data['block_num'], data['par_num'], data['line_num']
+        ):
+            if word.strip():
+                lines.setdefault((block, paragraph, line), []).append(word)
+        text = '\n'.join(' '.join(words) for words in lines.values())
+        
+        return text, [int(conf) for conf in data['conf'] if int(conf) > 0]
+    
+    def extract_text_easyocr(self, cv_image: np.ndarray) -> Dict:
+        """Extract text from a BGR image using EasyOCR"""
         try:
-            response = requests.get(image_url, timeout=10)
-            image = Image.open(BytesIO(response.content))
-            cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-            
-            results = self.easyocr_reader.readtext(cv_image)
-            
-            text_parts = []
-            confidences = []
-            
-            for (bbox, text, confidence) in results:
-                text_parts.append(text)
-                confidences.append(confidence)
-            
-            combined_text = ' '.join(text_parts)
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-            
-            return {
-                'text': combined_text.strip(),
-                'confidence': avg_confidence,
-                'engine': 'easyocr',
-                'success': True,
-                'detected_regions': len(results)
-            }
+            results = self.easyocr_reader.readtext(cv_image, batch_size=EASYOCR_BATCH_SIZE)
+            return _easyocr_result(results)
             
         except Exception as e:
-            logger.error("EasyOCR failed", url=image_url, error=str(e))
+            logger.error("EasyOCR failed", error=str(e))
             return {
                 'text': '',
                 'confidence': 0,
@@ -152,28 +281,168 @@ class OCREngine:
             }
     
     def extract_text(self, image_url: str) -> Dict:
-        """Extract text from image using configured OCR engine(s)"""
+        """
+        Extract text from image using configured OCR engine(s)
+        The image is downloaded and decoded once, and shared with the fallback engine.
+        Images already read successfully are answered from the result cache
+        """
+        cached = self._cached_result(image_url)
+        if cached is not None:
+            return cached
+        
+        try:
+            cv_image = self._load_image(image_url)
+        except Exception as e:
+            return self._download_failed(image_url, e)
+        
+        return self._remember(image_url, self._extract_from_image(cv_image, image_url))
+    
+    def _cached_result(self, image_url: str) -> Optional[Dict]:
+        """Copy of the cached OCR result for an image URL, if there is one"""
+        with self._results_lock:
+            result = self._results.get(image_url)
+        return dict(result) if result is not None else None
+    
+    def _remember(self, image_url: str, result: Dict) -> Dict:
+        """Cache a successful OCR result under its image URL and return it"""
+        if result['success']:
+            with self._results_lock:
+                self._results[image_url] = dict(result)
+        return result
+    
+    def _download_failed(self, image_url: str, error: Exception) -> Dict:
+        """Failure result for an image that could not be downloaded or decoded"""
+        logger.error("Image download failed", url=image_url, error=str(error))
+        return {
+            'text': '',
+            'confidence': 0,
+            'engine': self.primary_engine,
+            'success': False,
+            'error': str(error)
+        }
+    
+    def _extract_from_image(self, cv_image: np.ndarray, image_url: str) -> Dict:
+        """Run the primary engine on a decoded image, then the fallback if it fails"""
         if self.primary_engine == 'tesseract':
-            result = self.extract_text_tesseract(image_url)
+            result = self.extract_text_tesseract(cv_image)
         else:
-            result = self.extract_text_easyocr(image_url)
+            result = self.extract_text_easyocr(cv_image)
         
         if not result['success'] and self.fallback:
             logger.info("Primary OCR failed, trying fallback", url=image_url)
             
             if self.primary_engine == 'tesseract':
-                result = self.extract_text_easyocr(image_url)
+                result = self.extract_text_easyocr(cv_image)
             else:
-                result = self.extract_text_tesseract(image_url)
+                result = self.extract_text_tesseract(cv_image)
         
         return result
     
+    def extract_text_batch(self, image_urls: List[str], executor: Optional[Executor] = None) -> List[Dict]:
+        """
+        OCR a handful of images (e.g. one ad's creatives), in image_urls order
+        Each image is downloaded over the keep-alive session and read on one of
+        executor's threads, reusing that thread's Tesseract handle; EasyOCR images
+        go through the batched reader instead. Without an executor a temporary one is used
+        """
+        if not image_urls:
+            return []
+        
+        if self.primary_engine == 'easyocr':
+            return self._batch_extract_easyocr(image_urls)
+        
+        if executor is not None:
+            return list(executor.map(self.extract_text, image_urls))
+        with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(image_urls))) as executor:
+            return list(executor.map(self.extract_text, image_urls))
+    
     def batch_extract(self, image_urls: list) -> list:
-        """Extract text from multiple images in parallel"""
-        from joblib import Parallel, delayed
+        """
+        Extract text from multiple images in parallel
+        Worker threads share this engine's EasyOCR model; the OCR libraries release
+        the GIL, so no worker processes are needed. Async callers should await
+        batch_extract_async instead
+        """
+        if self.primary_engine == 'easyocr':
+            return self._batch_extract_easyocr(image_urls)
+        
+        return asyncio.run(self.batch_extract_async(image_urls))
+    
+    async def batch_extract_async(self, image_urls: list) -> list:
+        """
+        Async batch OCR: images download concurrently on the event loop while
+        decoding and OCR run on worker threads, so the two stages overlap.
+        At most IMAGES_IN_FLIGHT images are downloading or awaiting OCR at once
+        """
+        loop = asyncio.get_running_loop()
+        in_flight = asyncio.Semaphore(IMAGES_IN_FLIGHT)
+        
+        async def process(client: httpx.AsyncClient, executor: ThreadPoolExecutor, image_url: str) -> Dict:
+            cached = self._cached_result(image_url)
+            if cached is not None:
+                return cached
+            
+            async with in_flight:
+                try:
+                    response = await client.get(image_url)
+                    cv_image = await loop.run_in_executor(executor, self._decode_image, response.content)
+                except Exception as e:
+                    return self._download_failed(image_url, e)
+                result = await loop.run_in_executor(executor, self._extract_from_image, cv_image, image_url)
+                return self._remember(image_url, result)
         
-        results = Parallel(n_jobs=4)(
-            delayed(self.extract_text)(url) for url in image_urls
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=IMAGES_IN_FLIGHT, max_keepalive_connections=IMAGES_IN_FLIGHT),
+            retries=3
         )
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as executor:
+            async with httpx.AsyncClient(
+                timeout=10.0, headers=dict(self.session.headers), transport=transport, follow_redirects=True
+            ) as client:
+                return await asyncio.gather(*(process(client, executor, url) for url in image_urls))
+    
+    def _batch_extract_easyocr(self, image_urls: list) -> list:
+        """
+        EasyOCR batch: download the uncached images in parallel, then run same-sized
+        images through readtext_batched together so the detector's forward pass is shared.
+        Images that fail to load or to batch go through extract_text with its fallback
+        """
+        def try_load(image_url: str) -> Optional[np.ndarray]:
+            try:
+                return self._load_image(image_url)
+            except Exception:
+                return None
+        
+        results = [self._cached_result(image_url) for image_url in image_urls]
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as executor:
+            images = dict(zip(missing, executor.map(try_load, [image_urls[idx] for idx in missing])))
+        
+        # readtext_batched needs equal sizes; resizing would distort the creatives
+        by_shape = defaultdict(list)
+        for idx, image in images.items():
+            if image is not None:
+                by_shape[image.shape].append(idx)
+        
+        for indices in by_shape.values():
+            try:
+                batch = self.easyocr_reader.readtext_batched(
+                    [images[idx] for idx in indices], batch_size=EASYOCR_BATCH_SIZE
+                )
+            except Exception as e:
+                logger.warning("EasyOCR batch failed", images=len(indices), error=str(e))
+                continue
+            for idx, detections in zip(indices, batch):
+                results[idx] = self._remember(image_urls[idx], _easyocr_result(detections))
+        
+        retry = [idx for idx, result in enumerate(results) if result is None]
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as executor:
+            for idx, result in zip(retry, executor.map(self.extract_text, [image_urls[idx] for idx in retry])):
+                results[idx] = result
         
         return results
+    
+    def close(self):
+        """Release pooled HTTP connections"""
+        self.session.close()
@@ -1,14 +1,19 @@
 """Main preprocessing pipeline orchestrator"""
 
 import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 import structlog
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ThreadPoolExecutor
+from src.workers import WORKERS, shared_executor
 from src.preprocessing.image_processing.ocr_engine import OCREngine
-from src.preprocessing.text_processing.cleaner import TextCleaner, TextNormalizer
+from src.preprocessing.text_processing import cleaner
+from src.preprocessing.text_processing.cleaner import TextNormalizer
 
 logger = structlog.get_logger()
 
+# Images OCR'd per ad; they are downloaded and read concurrently
+MAX_IMAGES_PER_AD = 5
+
 
 class PreprocessingPipeline:
     """
@@ -18,8 +23,9 @@ class PreprocessingPipeline:
     
     def __init__(self):
         self.ocr_engine = OCREngine(primary_engine='tesseract', fallback=True)
-        self.text_cleaner = TextCleaner()
         self.text_normalizer = TextNormalizer()
+        # Threads for one ad's images: downloads and Tesseract both release the GIL
+        self._ocr_pool = ThreadPoolExecutor(max_workers=MAX_IMAGES_PER_AD, thread_name_prefix="ocr")
     
     def preprocess_single(self, raw_ad: Dict) -> Dict:
         """Preprocess a single ad through complete pipeline"""
@@ -29,11 +35,11 @@ class PreprocessingPipeline:
         
         try:
             # Clean text fields
-            headline = self.text_cleaner.clean(
+            headline = cleaner.clean(
                 raw_ad.get('headline'),
                 max_length=500
             )
-            body_text = self.text_cleaner.clean(
+            body_text = cleaner.clean(
                 raw_ad.get('body_text'),
                 max_length=5000
             )
@@ -43,24 +49,37 @@ class PreprocessingPipeline:
             enrichment_applied.append('text_cleaning')
             
             # Extract text from images via OCR
-            extracted_texts = []
+            extracted_text = ''
             media_images = []
             
-            if raw_ad.get('media_urls'):
-                for img_url in raw_ad['media_urls'][:5]:
-                    try:
-                        ocr_result = self.ocr_engine.extract_text(img_url)
-                        if ocr_result['success'] and ocr_result['text']:
-                            extracted_texts.append(ocr_result['text'])
-                        
-                        media_images.append({
-                            'url': img_url,
-                            'extracted_text': ocr_result.get('text', ''),
-                            'ocr_confidence': ocr_result.get('confidence', 0)
-                        })
-                    except Exception as e:
-                        logger.error("Image processing failed", url=img_url, error=str(e))
-                        validation_errors.append(f"OCR failed for {img_url}")
+            media_urls = raw_ad.get('media_urls')
+            if media_urls:
+                # Most ads have no more than MAX_IMAGES_PER_AD images; only copy when trimming
+                if len(media_urls) > MAX_IMAGES_PER_AD:
+                    img_urls = media_urls[:MAX_IMAGES_PER_AD]
+                else:
+                    img_urls = media_urls
+                try:
+                    ocr_results = self.ocr_engine.extract_text_batch(img_urls, self._ocr_pool)
+                except Exception as e:
+                    logger.error("Image processing failed", urls=img_urls, error=str(e))
+                    validation_errors.extend(f"OCR failed for {img_url}" for img_url in img_urls)
+                    ocr_results = []
+                
+                # Results come back in media_urls order, whichever image finishes first.
+                # Built in one expression each rather than grown by append
+                extracted_text = ' '.join([
+                    ocr_result['text'] for ocr_result in ocr_results
+                    if ocr_result['success'] and ocr_result['text']
+                ])
+                media_images = [
+                    {
+                        'url': img_url,
+                        'extracted_text': ocr_result.get('text', ''),
+                        'ocr_confidence': ocr_result.get('confidence', 0)
+                    }
+                    for img_url, ocr_result in zip(img_urls, ocr_results)
+                ]
                 
                 enrichment_applied.append('ocr')
             
@@ -79,7 +98,7 @@ class PreprocessingPipeline:
                     "headline": headline,
                     "body_text": body_text,
                     "call_to_action": cta,
-                    "extracted_text_from_images": ' '.join(extracted_texts),
+                    "extracted_text_from_images": extracted_text,
                     "media": {
                         "images": media_images,
                         "videos": []
@@ -133,29 +152,20 @@ class PreprocessingPipeline:
                 }
             }
     
-    def preprocess_batch(self, raw_ads: List[Dict], max_workers: int = 4) -> List[Dict]:
-        """Preprocess multiple ads in parallel"""
+    def preprocess_batch(self, raw_ads: List[Dict], max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Preprocess multiple ads in parallel
+        Uses the shared worker pool unless a specific max_workers is requested
+        """
         logger.info("Starting batch preprocessing",
                    total_ads=len(raw_ads),
-                   workers=max_workers)
+                   workers=max_workers or WORKERS)
         
-        preprocessed_ads = []
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_ad = {
-                executor.submit(self.preprocess_single, ad): ad
-                for ad in raw_ads
-            }
-            
-            for future in as_completed(future_to_ad):
-                try:
-                    result = future.result()
-                    preprocessed_ads.append(result)
-                except Exception as e:
-                    ad = future_to_ad[future]
-                    logger.error("Batch item failed",
-                                ad_id=ad.get('ad_id'),
-                                error=str(e))
+        if max_workers is None:
+            preprocessed_ads = self._run_batch(shared_executor(), raw_ads)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                preprocessed_ads = self._run_batch(executor, raw_ads)
         
         successful = sum(
             1 for ad in preprocessed_ads
@@ -168,3 +178,14 @@ class PreprocessingPipeline:
                    failed=len(preprocessed_ads) - successful)
         
         return preprocessed_ads
+    
+    def _run_batch(self, executor: Executor, raw_ads: List[Dict]) -> List[Dict]:
+        """
+        Results keep raw_ads order; preprocess_single reports its own failures,
+        so only a broken pool raises
+        """
+        try:
+            return list(executor.map(self.preprocess_single, raw_ads))
+        except Exception as e:
+            logger.error("Batch preprocessing failed", total_ads=len(raw_ads), error=str(e))
+            raise
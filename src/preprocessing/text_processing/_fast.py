@@ -0,0 +1,79 @@
+"""
+Byte-level kernels for ASCII text normalization
+Compiled with Numba when available; without it callers keep their regex path
+"""
+
+from typing import Sequence
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator - leaves the kernel as plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Byte classes of the brand kernel
+DROP = 0
+WORD = 1
+SPACE = 2
+
+
+def byte_table(lowered: Sequence[int], classes: Sequence[int]) -> np.ndarray:
+    """(2, 128) table of the lowercased value and class of every ASCII byte"""
+    return np.array([lowered, classes], dtype=np.uint8)
+
+
+def word_table(words: Sequence[str]) -> np.ndarray:
+    """Words as zero-padded rows of ASCII bytes, one row per word"""
+    table = np.zeros((len(words), max(len(word) for word in words)), dtype=np.uint8)
+    for i, word in enumerate(words):
+        table[i, :len(word)] = np.frombuffer(word.encode('ascii'), dtype=np.uint8)
+    return table
+
+
+@njit(cache=True, nogil=True)
+def _is_listed(out: np.ndarray, start: int, end: int, words: np.ndarray) -> bool:
+    """Whether out[start:end] is exactly one of the rows of words"""
+    length = end - start
+    for row in range(words.shape[0]):
+        if length > words.shape[1] or (length < words.shape[1] and words[row, length] != 0):
+            continue
+        match = True
+        for k in range(length):
+            if out[start + k] != words[row, k]:
+                match = False
+                break
+        if match:
+            return True
+    return False
+
+
+@njit(cache=True, nogil=True)
+def join_words_ascii(buf: np.ndarray, table: np.ndarray, stopwords: np.ndarray) -> np.ndarray:
+    """
+    One pass over ASCII bytes: lowercase them, drop DROP bytes, split words on
+    SPACE bytes, leave out words listed in stopwords and join the rest with no separator
+    """
+    out = np.empty(buf.shape[0], dtype=np.uint8)
+    pos = 0
+    word_start = 0
+    for i in range(buf.shape[0]):
+        byte = buf[i]
+        kind = table[1, byte]
+        if kind == WORD:
+            out[pos] = table[0, byte]
+            pos += 1
+        elif kind == SPACE:
+            if pos > word_start and _is_listed(out, word_start, pos, stopwords):
+                pos = word_start
+            word_start = pos
+    if pos > word_start and _is_listed(out, word_start, pos, stopwords):
+        pos = word_start
+    return out[:pos]
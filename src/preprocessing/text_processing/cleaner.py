@@ -1,79 +1,239 @@
 """Text cleaning and normalization utilities"""
 
 import re
+import unicodedata
+from functools import lru_cache
+from itertools import chain
 import ftfy
+from ftfy import chardata
+from ftfy.badness import is_bad
 from unidecode import unidecode
 import emoji
-from typing import Optional
+import numpy as np
+from typing import Iterable, List, Optional
+from src.preprocessing.text_processing import _fast
 
 
-class TextCleaner:
-    """Clean and normalize text from various sources"""
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regex matching any of words, nested as a prefix trie ('co(?:rp(?:oration)?|mpany)?'
+    rather than 'co|corp|corporation|company'), so matching walks each shared prefix
+    once instead of retrying every alternative - it stays linear as the word list grows
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
     
-    @staticmethod
-    def fix_encoding(text: str) -> str:
-        """Fix common encoding issues"""
-        return ftfy.fix_text(text)
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = '|'.join(branches)
+        if '' in node:
+            # A word ends here too. The optional group tries the longer words first
+            # and backs off to this one, as the plain alternation would
+            return f'(?:{pattern})?'
+        return pattern if len(branches) == 1 else f'(?:{pattern})'
     
-    @staticmethod
-    def remove_extra_whitespace(text: str) -> str:
-        """Remove extra whitespace and normalize line breaks"""
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
+    return build(trie)
+
+
+# Patterns used on every ad, compiled once at import
+_WS_RE = re.compile(r'\s+')
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+_HTML_RE = re.compile(r'<[^>\n]*>')
+_NONALNUM_RE = re.compile(r'[^a-z0-9\s]')
+_MULTIPUNCT_RE = re.compile(r'[!?.]{2,}')
+
+# Smart quotes mapped to their ASCII forms in one str.translate pass
+_QUOTE_TABLE = str.maketrans({
+    '\u201c': '"', '\u201d': '"',
+    '\u2018': "'", '\u2019': "'",
+    '\u201e': '"', '\u201f': '"',
+})
+
+# Everything clean() rewrites, found in one scan: HTML tags together with the
+# whitespace around them, smart quotes, and whitespace that isn't a single space
+_CLEAN_RE = re.compile(
+    r'(\s*(?:<[^>\n]*>\s*)+)'
+    r'|([\u2018\u2019\u201c\u201d\u201e\u201f])'
+    r'|\s{2,}|[^\S ]'
+)
+
+# ASCII text without these has nothing for clean() to do beyond stripping the ends:
+# no entities or control characters for ftfy, no tags, and no whitespace but single spaces
+_ASCII_CLEAN_RE = re.compile(r'[&<\x00-\x1f\x7f]| {2}')
+
+# Company-form suffixes stripped from brand names
+_BRAND_SUFFIXES = ('inc', 'llc', 'ltd', 'corp', 'corporation', 'company', 'co')
+_SUFFIX_RE = re.compile(rf"\b{_trie_pattern(_BRAND_SUFFIXES)}\b")
+
+# The same brand normalization as byte tables for the ASCII kernel, with each
+# byte classified by the regexes above so both paths agree
+_BRAND_BYTES = _fast.byte_table(
+    [ord(chr(byte).lower()) for byte in range(128)],
+    [
+        _fast.SPACE if _WS_RE.match(chr(byte))
+        else _fast.DROP if _NONALNUM_RE.match(chr(byte).lower())
+        else _fast.WORD
+        for byte in range(128)
+    ]
+)
+_SUFFIX_WORDS = _fast.word_table(_BRAND_SUFFIXES)
+# Below this length the kernel's call overhead costs more than the three regex passes
+FAST_BRAND_MIN_LENGTH = 24
+
+# Distinct texts whose ftfy result is kept. Ad copy repeats across keywords,
+# platforms and re-collections, and ftfy is pure Python holding the GIL throughout
+FIX_CACHE_SIZE = 4096
+
+
+def _char_class(chars: Iterable[str]) -> str:
+    """Regex character class for chars, with consecutive code points merged into ranges"""
+    ranges = []
+    for code in sorted(set(map(ord, chars))):
+        if ranges and code == ranges[-1][1] + 1:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    return '[' + ''.join(
+        re.escape(chr(lo)) if lo == hi else f'{re.escape(chr(lo))}-{re.escape(chr(hi))}'
+        for lo, hi in ranges
+    ) + ']'
+
+
+# Every character one of ftfy's character-level fixes would change, from ftfy's own
+# tables: entities, CR and escape sequences, control characters, C1 controls, Latin
+# ligatures, full/half-width forms, curly quotes, Unicode line breaks and surrogates.
+# Text without them, in NFC and not flagged as mojibake, comes out of ftfy unchanged
+_FTFY_CHARS_RE = re.compile(_char_class(chain(
+    '&\r\x1b\u2028\u2029',
+    map(chr, chardata.CONTROL_CHARS),
+    map(chr, chardata.LIGATURES),
+    map(chr, chardata.WIDTH_MAP),
+    map(chr, range(0x80, 0xa0)),
+    map(chr, range(0xd800, 0xe000)),
+    '\u02bc\u2018\u2019\u201a\u201b\u201c\u201d\u201e\u201f'
+)))
+# ftfy fixes text one line at a time, and its mojibake detector anchors on line starts
+_LINE_RE = re.compile(r'[^\n]*\n|[^\n]+\Z')
+
+# Where an emoji can start: any non-ASCII first code point of one, or a keycap
+# base (#, *, 0-9) followed by the rest of its sequence
+_EMOJI_MAX_LENGTH = max(map(len, emoji.EMOJI_DATA))
+_EMOJI_START_RE = re.compile(
+    _char_class(e[0] for e in emoji.EMOJI_DATA if not e[0].isascii())
+    + '|' + _char_class(e[0] for e in emoji.EMOJI_DATA if e[0].isascii())
+    + '(?=' + _char_class(e[1] for e in emoji.EMOJI_DATA if e[0].isascii()) + ')'
+)
+
+
+def _find_emojis(text: str) -> List[str]:
+    """
+    Emojis in text, as emoji.emoji_list finds them: at each possible start,
+    the longest sequence that is a known emoji
+    """
+    found = []
+    end = 0
+    for match in _EMOJI_START_RE.finditer(text):
+        start = match.start()
+        if start < end:
+            continue
+        for length in range(min(_EMOJI_MAX_LENGTH, len(text) - start), 0, -1):
+            candidate = text[start:start + length]
+            if candidate in emoji.EMOJI_DATA:
+                found.append(candidate)
+                end = start + length
+                break
+    return found
+
+
+def _clean_replacement(match: re.Match) -> str:
+    """Replacement for one _CLEAN_RE match, same result as the separate cleaning steps"""
+    tags, quote = match.groups()
+    if tags is not None:
+        # A tag collapses into the text around it unless whitespace sat next to it
+        return ' ' if _HTML_RE.sub('', tags) else ''
+    if quote is not None:
+        return quote.translate(_QUOTE_TABLE)
+    return ' '
+
+
+def fix_encoding(text: str) -> str:
+    """
+    Fix common encoding issues
+    ftfy only runs on text it would change: text with characters one of its fixes
+    rewrites, that isn't NFC-normalized, or that its mojibake detector flags
+    """
+    if (not _FTFY_CHARS_RE.search(text)
+            and unicodedata.is_normalized('NFC', text)
+            and (text.isascii()
+                 or not any(is_bad(line.group()) for line in _LINE_RE.finditer(text)))):
         return text
-    
-    @staticmethod
-    def normalize_unicode(text: str, preserve_emojis: bool = True) -> str:
-        """Normalize unicode characters"""
-        if not preserve_emojis:
-            text = emoji.demojize(text)
+    return _fix_text(text)
+
+
+@lru_cache(maxsize=FIX_CACHE_SIZE)
+def _fix_text(text: str) -> str:
+    """ftfy.fix_text, memoized in one cache per process, shared by its threads"""
+    return ftfy.fix_text(text)
+
+
+def remove_extra_whitespace(text: str) -> str:
+    """Remove extra whitespace and normalize line breaks"""
+    text = _WS_RE.sub(' ', text)
+    text = text.strip()
+    return text
+
+
+def normalize_unicode(text: str, preserve_emojis: bool = True) -> str:
+    """Normalize unicode characters"""
+    if not preserve_emojis:
+        text = emoji.demojize(text)
+    return text
+
+
+def remove_urls(text: str) -> str:
+    """Remove URLs from text"""
+    return _URL_RE.sub('', text)
+
+
+def remove_html_tags(text: str) -> str:
+    """Remove HTML tags"""
+    return _HTML_RE.sub('', text)
+
+
+def standardize_quotes(text: str) -> str:
+    """Convert smart quotes to standard quotes"""
+    return text.translate(_QUOTE_TABLE)
+
+
+def truncate(text: str, max_length: int, suffix: str = '...') -> str:
+    """Truncate text to max length"""
+    if len(text) <= max_length:
         return text
+    return text[:max_length - len(suffix)] + suffix
+
+
+def clean(text: Optional[str], max_length: Optional[int] = None) -> str:
+    """Apply all cleaning steps"""
+    if not text:
+        return ''
     
-    @staticmethod
-    def remove_urls(text: str) -> str:
-        """Remove URLs from text"""
-        url_pattern = r'https?://\S+|www\.\S+'
-        return re.sub(url_pattern, '', text)
-    
-    @staticmethod
-    def remove_html_tags(text: str) -> str:
-        """Remove HTML tags"""
-        clean_pattern = re.compile('<.*?>')
-        return re.sub(clean_pattern, '', text)
-    
-    @staticmethod
-    def standardize_quotes(text: str) -> str:
-        """Convert smart quotes to standard quotes"""
-        replacements = {
-            '"': '"', '"': '"',
-            ''': "'", ''': "'",
-            '„': '"', '‟': '"',
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        return text
+    if text.isascii() and not _ASCII_CLEAN_RE.search(text):
+        text = text.strip()
+    else:
+        text = fix_encoding(text)
+        # Tags, quotes and whitespace in one pass instead of three
+        text = _CLEAN_RE.sub(_clean_replacement, text).strip()
     
-    @staticmethod
-    def truncate(text: str, max_length: int, suffix: str = '...') -> str:
-        """Truncate text to max length"""
-        if len(text) <= max_length:
-            return text
-        return text[:max_length - len(suffix)] + suffix
+    if max_length:
+        text = truncate(text, max_length)
     
-    def clean(self, text: Optional[str], max_length: Optional[int] = None) -> str:
-        """Apply all cleaning steps"""
-        if not text:
-            return ''
-        
-        text = self.fix_encoding(text)
-        text = self.remove_html_tags(text)
-        text = self.standardize_quotes(text)
-        text = self.remove_extra_whitespace(text)
-        
-        if max_length:
-            text = self.truncate(text, max_length)
-        
-        return text
+    return text
 
 
 class TextNormalizer:
@@ -81,32 +241,36 @@ class TextNormalizer:
     
     @staticmethod
     def normalize_brand_name(brand: str) -> str:
-        """Normalize brand name for consistent matching"""
-        normalized = brand.lower()
-        normalized = re.sub(r'[™®©]', '', normalized)
-        normalized = re.sub(r'[^a-z0-9\s]', '', normalized)
-        
-        suffixes = ['inc', 'llc', 'ltd', 'corp', 'corporation', 'company', 'co']
-        for suffix in suffixes:
-            normalized = re.sub(rf'\b{suffix}\b', '', normalized)
+        """
+        Normalize brand name for consistent matching
+        Long ASCII names take a single compiled pass over their bytes when Numba is installed
+        """
+        if _fast.NUMBA_AVAILABLE and len(brand) >= FAST_BRAND_MIN_LENGTH and brand.isascii():
+            buf = np.frombuffer(brand.encode('ascii'), dtype=np.uint8)
+            return _fast.join_words_ascii(buf, _BRAND_BYTES, _SUFFIX_WORDS).tobytes().decode('ascii')
         
-        normalized = re.sub(r'\s+', '', normalized)
+        normalized = brand.lower()
+        # ™ ® © are not in [a-z0-9\s], so this also drops trademark symbols
+        normalized = _NONALNUM_RE.sub('', normalized)
+        normalized = _SUFFIX_RE.sub('', normalized)
+        normalized = _WS_RE.sub('', normalized)
         return normalized.strip()
     
     @staticmethod
     def normalize_call_to_action(cta: str) -> str:
         """Standardize CTA text"""
         cta = cta.lower().strip()
-        cta = re.sub(r'[!?.]{2,}', '', cta)
-        cta = re.sub(r'\s+', ' ', cta)
+        cta = _MULTIPUNCT_RE.sub('', cta)
+        cta = _WS_RE.sub(' ', cta)
         return cta.strip()
     
     @staticmethod
     def detect_emojis(text: str) -> dict:
         """Detect and count emojis in text"""
-        emoji_list = emoji.emoji_list(text)
+        # Every emoji has a non-ASCII code point, so ASCII text needs no scan
+        emojis = [] if text.isascii() else _find_emojis(text)
         return {
-            'contains_emojis': len(emoji_list) > 0,
-            'emoji_count': len(emoji_list),
-            'emojis': [e['emoji'] for e in emoji_list]
+            'contains_emojis': len(emojis) > 0,
+            'emoji_count': len(emojis),
+            'emojis': emojis
         }
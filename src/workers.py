@@ -0,0 +1,14 @@
+"""Worker pool sizing shared by the batch pipelines"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# One less than the CPU count leaves a core for the event loop / main thread
+WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+
+@lru_cache(maxsize=1)
+def shared_executor() -> ThreadPoolExecutor:
+    """Process-wide pool reused by every batch call instead of one pool per call"""
+    return ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="batch-worker")
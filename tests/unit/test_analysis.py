@@ -0,0 +1,155 @@
+"""Test performance analysis"""
+
+import numpy as np
+import pytest
+from src.analysis.performance_analyzer import PerformanceAnalyzer
+from src.analysis.ad_table import AdTable
+from src.analysis._kernels import roi_kernel, score_kernel, score_columns
+
+
+@pytest.fixture
+def scored_ads():
+    """Ads covering the ROI and content-score branches"""
+    return [
+        {
+            'ad_id': 'full',
+            'platform': 'meta',
+            'brand_name': 'Brand A',
+            'headline': 'Sale',
+            'body_text': 'Body',
+            'call_to_action': 'Shop Now',
+            'media_urls': ['https://example.com/a.jpg'],
+            'impressions': 10000,
+            'spend_range': {'lower': 100, 'upper': 500}
+        },
+        {
+            'ad_id': 'lower_only',
+            'platform': 'meta',
+            'brand_name': 'Brand B',
+            'headline': 'Sale',
+            'impressions': 250000,
+            'spend_range': {'lower': 100, 'upper': 0}
+        },
+        {
+            'ad_id': 'no_spend',
+            'platform': 'google',
+            'brand_name': 'Brand A',
+            'impressions': 5000,
+            'spend_range': None
+        },
+        {
+            'ad_id': 'empty',
+            'platform': 'google',
+        },
+    ]
+
+
+def test_batch_scores_match_single_ad_scoring(scored_ads):
+    """Test vectorized batch scoring agrees with the per-ad methods"""
+    analyzer = PerformanceAnalyzer()
+
+    results = analyzer.analyze_batch(scored_ads)
+    by_id = {ad['ad_id']: ad for ad in results['analyzed_ads']}
+
+    for ad in scored_ads:
+        assert by_id[ad['ad_id']]['roi'] == analyzer.calculate_roi(ad)
+        assert by_id[ad['ad_id']]['performance_score'] == analyzer.calculate_performance_score(ad)
+
+
+def test_analyze_batch_summary(scored_ads):
+    """Test summary picks the best and worst ads"""
+    analyzer = PerformanceAnalyzer()
+
+    results = analyzer.analyze_batch(scored_ads)
+
+    assert results['total_ads'] == 4
+    assert results['summary']['top_performing_ad'] == 'lower_only'
+    assert results['summary']['worst_performing_ad'] == 'empty'
+
+
+def test_analyze_empty_batch():
+    """Test empty input returns an empty analysis"""
+    results = PerformanceAnalyzer().analyze_batch([])
+
+    assert results['total_ads'] == 0
+    assert results['analyzed_ads'] == []
+
+
+def test_analyze_batch_top_k(scored_ads):
+    """Test top_k truncates performer lists but not their counts"""
+    analyzer = PerformanceAnalyzer()
+
+    full = analyzer.analyze_batch(scored_ads)
+    truncated = analyzer.analyze_batch(scored_ads, top_k=1)
+
+    assert len(truncated['low_performers']) == 1
+    assert truncated['summary']['low_performers_count'] == full['summary']['low_performers_count']
+
+
+def test_ad_table_columns(scored_ads):
+    """Test AdTable keeps one row per ad with missing fields as zero"""
+    table = AdTable.from_ads(scored_ads)
+
+    assert len(table) == 4
+    assert table.impressions.tolist() == [10000, 250000, 5000, 0]
+    assert table.spend_upper.tolist() == [500, 0, 0, 0]
+    assert table.content_score.tolist() == [30, 10, 0, 0]
+
+
+def test_ad_table_ignores_malformed_spend_range():
+    """Test a spend_range that is not a dict counts as no spend"""
+    table = AdTable.from_ads([{'impressions': 1000, 'spend_range': 'abc'}, {'spend_range': [1, 2]}])
+
+    assert table.spend_lower.tolist() == [0, 0]
+    assert table.spend_upper.tolist() == [0, 0]
+
+
+def test_per_ad_and_batch_paths_agree():
+    """Test calculate_roi and the score match analyze_batch on malformed fields"""
+    analyzer = PerformanceAnalyzer()
+    ads = [
+        {'impressions': '1000', 'spend_range': {'lower': 10, 'upper': 20}},
+        {'impressions': 1000, 'spend_range': {'lower': '10', 'upper': 20}},
+        {'impressions': 1000, 'spend_range': {'lower': 10, 'upper': None}},
+        {'impressions': None, 'spend_range': 'abc', 'headline': 'Sale'},
+        {'impressions': 2500.5, 'spend_range': {'lower': 0, 'upper': 0}},
+        {'impressions': 12345, 'spend_range': {'lower': 37, 'upper': 333}, 'media_urls': ['x']},
+    ]
+    expected = [(analyzer.calculate_roi(ad), analyzer.calculate_performance_score(ad)) for ad in ads]
+
+    results = analyzer.analyze_batch(
+        [dict(ad, ad_id=str(i)) for i, ad in enumerate(ads)], sort_results=False
+    )
+
+    assert [(ad['roi'], ad['performance_score']) for ad in results['analyzed_ads']] == expected
+
+
+def test_fused_kernel_matches_vectorized_kernels():
+    """Test the fused kernel rounds exactly like the vectorized kernels"""
+    rng = np.random.default_rng(0)
+    impressions = rng.integers(0, 300000, 10000).astype(np.float64)
+    spend_lower = rng.choice([0, 37, 100, 1000], 10000).astype(np.float64)
+    spend_upper = rng.choice([0, 333, 500, 5000], 10000).astype(np.float64)
+    content_score = rng.choice([0, 5, 10, 15, 20, 25, 30], 10000).astype(np.float64)
+
+    roi, score = score_columns(impressions, spend_lower, spend_upper, content_score)
+    expected_roi = roi_kernel(impressions, spend_lower, spend_upper)
+
+    assert np.array_equal(roi, expected_roi)
+    assert np.array_equal(score, score_kernel(expected_roi, impressions, content_score))
+
+
+def test_analyze_batch_unsorted(scored_ads):
+    """Test sort_results=False keeps input order and the same summary picks"""
+    results = PerformanceAnalyzer().analyze_batch(scored_ads, sort_results=False)
+
+    assert [ad['ad_id'] for ad in results['analyzed_ads']] == ['full', 'lower_only', 'no_spend', 'empty']
+    assert results['summary']['top_performing_ad'] == 'lower_only'
+    assert results['summary']['worst_performing_ad'] == 'empty'
+
+
+def test_analyze_batch_shares_timestamp(scored_ads):
+    """Test every ad and the batch carry one analyzed_at timestamp"""
+    results = PerformanceAnalyzer().analyze_batch(scored_ads)
+
+    assert {ad['analyzed_at'] for ad in results['analyzed_ads']} == {results['analyzed_at']}
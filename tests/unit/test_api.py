@@ -0,0 +1,86 @@
+"""Test the agent's HTTP API"""
+
+import pytest
+from fastapi.testclient import TestClient
+import api_server
+from api_server import app
+from src.collection.collectors.base_collector import CollectionConfig
+from src.collection.collectors.mock_collector import MockAdCollector
+
+
+def test_app_restarts_in_one_process():
+    """Test a second lifespan starts with its own stage executor"""
+    for _ in range(2):
+        with TestClient(app) as client:
+            assert client.get('/health').status_code == 200
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client whose collectors are counted and whose reports are not written"""
+    collectors = []
+
+    def get_collector(platform, keywords, max_results):
+        collector = MockAdCollector(CollectionConfig(
+            platform='mock', keywords=list(keywords), max_results=max_results,
+            rate_limit_per_second=0
+        ))
+        collectors.append(collector)
+        return collector
+
+    monkeypatch.setattr(api_server, 'get_collector', get_collector)
+    api_server.RESPONSE_CACHE.clear()
+    with TestClient(app) as client:
+        monkeypatch.setattr(api_server.REPORT_GEN, 'generate_all_reports', lambda *args: None)
+        client.collectors = collectors
+        yield client
+    api_server.RESPONSE_CACHE.clear()
+
+
+def test_collect_cache_hit(client):
+    """Test an identical request is served from cache with fresh timing"""
+    body = {'keywords': ['shoes', 'sale'], 'platform': 'meta', 'max_results': 3}
+
+    first = client.post('/api/v1/collect', json=body).json()
+    second = client.post('/api/v1/collect', json=body).json()
+
+    assert len(client.collectors) == 1
+    assert second['ads'] == first['ads']
+    assert second['reports'] == first['reports']
+    assert second['execution_time_seconds'] != first['execution_time_seconds']
+
+
+def test_collect_cache_key(client):
+    """Test keyword order is ignored but other fields and verbose are not"""
+    client.post('/api/v1/collect', json={'keywords': ['shoes', 'sale'], 'platform': 'meta', 'max_results': 3})
+    client.post('/api/v1/collect', json={'keywords': ['sale', 'shoes'], 'platform': 'meta', 'max_results': 3})
+    assert len(client.collectors) == 1
+
+    client.post('/api/v1/collect', json={'keywords': ['shoes', 'sale'], 'platform': 'meta', 'max_results': 4})
+    client.post('/api/v1/collect?verbose=1', json={'keywords': ['shoes', 'sale'], 'platform': 'meta', 'max_results': 3})
+    assert len(client.collectors) == 3
+
+
+def test_collect_mock_not_cached(client):
+    """Test mock requests draw new ads every time"""
+    body = {'keywords': ['shoes'], 'platform': 'mock', 'max_results': 3}
+
+    client.post('/api/v1/collect', json=body)
+    client.post('/api/v1/collect', json=body)
+
+    assert len(client.collectors) == 2
+
+
+def test_collect_validation_errors(client):
+    """Test invalid bodies get FastAPI's 422 error list and lax values are still coerced"""
+    response = client.post('/api/v1/collect', json={'keywords': 'shoes'})
+
+    assert response.status_code == 422
+    assert response.json()['detail'] == [{
+        'type': 'list_type', 'loc': ['body', 'keywords'],
+        'msg': 'Input should be a valid list', 'input': 'shoes'
+    }]
+
+    response = client.post('/api/v1/collect', json={'keywords': ['shoes'], 'platform': 'meta', 'max_results': '2'})
+    assert response.status_code == 200
+    assert client.collectors[0].config.max_results == 2
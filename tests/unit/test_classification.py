@@ -72,3 +72,14 @@ def test_classification_pipeline():
     assert 'classifications' in result
     assert 'ad_format' in result['classifications']
     assert result['classification_metadata']['total_inference_time_ms'] > 0
+
+
+
+def test_classify_batch_legacy_arguments():
+    """Test classify_batch still accepts max_workers and use_threads"""
+    pipeline = ClassificationPipeline()
+    ads = [{'ad_id': f'test_{i}', 'content': {'media': {'images': ['image.jpg']}}} for i in range(3)]
+    
+    for kwargs in ({}, {'max_workers': 4}, {'use_threads': True}):
+        results = pipeline.classify_batch(ads, **kwargs)
+        assert [result['ad_id'] for result in results] == ['test_0', 'test_1', 'test_2']
@@ -13,7 +13,7 @@ class MockCollector(BaseCollector):
             {'id': '2', 'text': 'Test ad 2'}
         ]
     
-    def normalize(self, raw_data):
+    def normalize(self, raw_data, collected_at=None):
         return {
             'ad_id': raw_data['id'],
             'content': raw_data['text']
@@ -64,3 +64,234 @@ def test_rate_limiting():
     
     # Should take at least 0.5 seconds (1/2.0)
     assert elapsed >= 0.4
+
+
+def test_collector_run_async():
+    """Test async run normalizes the same ads as run"""
+    import asyncio
+    
+    config = CollectionConfig(
+        platform='test',
+        keywords=['test'],
+        max_results=10
+    )
+    collector = MockCollector(config)
+    results = asyncio.run(collector.run_async())
+    
+    assert [ad['ad_id'] for ad in results] == ['1', '2']
+
+
+def test_google_xpath_parser_matches_soup():
+    """Test the lxml XPath ad parser extracts the same fields as BeautifulSoup"""
+    from src.collection.collectors.google_ads_collector import GoogleAdsCollector
+    
+    config = CollectionConfig(
+        platform='google',
+        keywords=['test'],
+        max_results=3
+    )
+    collector = GoogleAdsCollector(config)
+    page = (
+        '<html><body>'
+        '<div class="result ad-item" data-id="1" data-advertiser="Acme">'
+        '<div><h3>Big <b>Sale</b></h3></div><p>First</p><p>Second</p><a href="/ad/1">Go</a>'
+        '</div>'
+        '<div class="ad-item-preview"><h3>Not an ad</h3></div>'
+        '<div class="ad-item"></div>'
+        '<div class="ad-item"><h3>Third</h3></div>'
+        '<div class="ad-item"><h3>Over the limit</h3></div>'
+        '</body></html>'
+    )
+    
+    ads = collector._parse_ads(page)
+    
+    assert ads == collector._parse_ads_soup(page)
+    assert ads[0] == {
+        'id': '1',
+        'title': 'Big Sale',
+        'description': 'First',
+        'advertiser': 'Acme',
+        'url': '/ad/1'
+    }
+    assert len(ads) == 3
+
+
+def test_gather_keywords_keeps_keyword_order():
+    """Test concurrent keyword collection returns ads in keyword order, capped at max_results"""
+    import asyncio
+    
+    class KeywordCollector(MockCollector):
+        async def _collect_keyword(self, keyword):
+            # Later keywords finish first
+            await asyncio.sleep(0.01 * (3 - len(keyword)))
+            return [{'id': f'{keyword}{i}', 'text': keyword} for i in range(2)]
+        
+        async def collect_async(self):
+            return await self._gather_keywords(self._collect_keyword)
+        
+        def collect(self):
+            return self._run_collect_async()
+    
+    config = CollectionConfig(
+        platform='test',
+        keywords=['a', 'bb', 'ccc'],
+        max_results=5,
+        concurrency=2
+    )
+    results = KeywordCollector(config).run()
+    
+    assert [ad['ad_id'] for ad in results] == ['a0', 'a1', 'bb0', 'bb1', 'ccc0']
+
+
+def test_memoize_page():
+    """Test page fetches are cached by arguments, except empty pages and forced refreshes"""
+    import asyncio
+    from src.collection.page_cache import memoize_page
+    
+    calls = []
+    
+    class PageCollector(MockCollector):
+        @memoize_page(key_prefix="test")
+        async def fetch(self, keyword, page=1):
+            calls.append((keyword, page))
+            return {'data': [{'id': f'{keyword}{page}'}] if page < 3 else []}
+    
+    collector = PageCollector(CollectionConfig(platform='test', keywords=['test']))
+    
+    async def fetch_all():
+        first = await collector.fetch('a', page=1)
+        first['data'].clear()  # Callers get their own copy
+        return [
+            await collector.fetch('a', page=1),
+            await collector.fetch('a', page=1, force_refresh=True),
+            await collector.fetch('a', page=3),
+            await collector.fetch('a', page=3),
+        ]
+    
+    pages = asyncio.run(fetch_all())
+    
+    assert pages[0] == {'data': [{'id': 'a1'}]}
+    assert calls == [('a', 1), ('a', 1), ('a', 3), ('a', 3)]
+
+
+def test_meta_search_response_parsing():
+    """Test Ad Library search endpoint responses map to the scraped ad fields"""
+    import json
+    from src.collection.collectors.meta_web_scraper import _parse_search_response
+    
+    payload = {
+        'payload': {
+            'forwardCursor': 'next',
+            'results': [[{
+                'adArchiveID': '123',
+                'pageName': 'Acme',
+                'snapshot': {
+                    'title': 'Big Sale',
+                    'body': {'markup': {'__html': 'Save <b>50%</b> &amp; more'}},
+                    'cta_text': 'Shop Now',
+                    'images': [{'original_image_url': 'https://img/1.jpg'}],
+                    'cards': [{'body': 'Card text', 'images': [{'resized_image_url': 'https://img/2.jpg'}]}]
+                }
+            }], [{'adArchiveID': '456', 'snapshot': {}}]]
+        }
+    }
+    
+    ads, cursor = _parse_search_response('for (;;);' + json.dumps(payload), '2024-01-01T00:00:00')
+    
+    assert cursor == 'next'
+    assert ads[0] == {
+        'id': '123',
+        'scraped_at': '2024-01-01T00:00:00',
+        'ad_snapshot_url': 'https://www.facebook.com/ads/library/?id=123',
+        'full_text': 'Big Sale Save 50% & more Card text Shop Now',
+        'page_name': 'Acme',
+        'ad_creative_bodies': ['Save 50% & more', 'Card text'],
+        'images': ['https://img/1.jpg', 'https://img/2.jpg']
+    }
+    assert ads[1]['page_name'] == 'Unknown'
+    assert 'ad_creative_bodies' not in ads[1]
+
+
+def test_meta_searches_each_keyword():
+    """Test Meta sends one search per keyword rather than a combined query"""
+    import asyncio
+    from src.collection.collectors.meta_ad_library import MetaAdLibraryCollector
+    
+    queries = []
+    
+    class QueryCollector(MetaAdLibraryCollector):
+        async def _collect_keyword(self, keyword):
+            queries.append(keyword)
+            return [{'id': keyword}]
+    
+    keywords = ['coffee', 'tea', 'juice']
+    collector = QueryCollector(CollectionConfig(platform='meta', keywords=keywords))
+    ads = asyncio.run(collector.collect_async())
+    
+    assert sorted(queries) == sorted(keywords)
+    assert [ad['id'] for ad in ads] == keywords
+    assert collector.normalize(ads[0])['detected_keywords'] is collector.keywords
+
+
+def test_mock_metrics_kernel_matches_vectorized():
+    """Test the fused mock metrics kernel matches the NumPy version exactly"""
+    import numpy as np
+    from src.collection.collectors._mock_kernels import mock_metrics, metrics_vectorized
+    
+    rng = np.random.default_rng(0)
+    n = 10000
+    spend_lower = rng.integers(500, 5001, n)
+    draws = (
+        spend_lower,
+        spend_lower + rng.integers(2000, 15001, n),
+        rng.uniform(5, 20, n),
+        rng.uniform(0.7, 0.9, n),
+        rng.uniform(1.1, 1.5, n),
+        rng.uniform(0.0, 5.0, n),  # Includes ads with no clicks
+        rng.uniform(0.01, 0.15, n)
+    )
+    
+    for fused, expected in zip(mock_metrics(*draws), metrics_vectorized(*draws)):
+        assert np.array_equal(fused, expected)
+
+
+def test_mock_collector_seed():
+    """Test a seeded mock collector reproduces its ads regardless of the random module"""
+    import random
+    from src.collection.collectors.mock_collector import MockAdCollector
+    
+    def collect(seed):
+        random.seed()  # Seeded collectors must not depend on the global state
+        config = CollectionConfig(platform='mock', keywords=['test'], max_results=20, seed=seed)
+        return [
+            {k: v for k, v in ad.items() if not k.startswith('ad_delivery')}
+            for ad in MockAdCollector(config).collect()
+        ]
+    
+    assert collect(7) == collect(7)
+    assert collect(7) != collect(8)
+
+
+def test_retry_predicates():
+    """Test only 429 (sync) and 429/5xx (async) responses are retried by tenacity"""
+    import httpx
+    import requests
+    from src.collection.collectors.base_collector import _is_rate_limited, _is_retryable_async
+    
+    def sync_error(status):
+        response = requests.Response()
+        response.status_code = status
+        return requests.HTTPError(response=response)
+    
+    def async_error(status):
+        request = httpx.Request('GET', 'https://example.com')
+        return httpx.HTTPStatusError('', request=request, response=httpx.Response(status, request=request))
+    
+    assert _is_rate_limited(sync_error(429))
+    assert not _is_rate_limited(sync_error(503))
+    assert not _is_rate_limited(requests.ConnectionError())
+    
+    assert _is_retryable_async(async_error(429))
+    assert _is_retryable_async(async_error(503))
+    assert not any(_is_retryable_async(async_error(status)) for status in (400, 401, 403, 404))
+    assert not _is_retryable_async(httpx.ConnectError('refused'))
@@ -0,0 +1,41 @@
+"""Test streaming pipeline orchestrator"""
+
+import pytest
+from src.collection.collectors.base_collector import BaseCollector, CollectionConfig
+from src.preprocessing.pipeline import PreprocessingPipeline
+from src.classification.pipeline import ClassificationPipeline
+from src.pipeline import StreamingPipeline
+
+
+class StreamingCollector(BaseCollector):
+    """Collector that yields ads one at a time"""
+
+    def collect(self):
+        for i in range(5):
+            yield {'id': str(i), 'title': f'Ad {i}'}
+
+    def normalize(self, raw_data, collected_at=None):
+        return {
+            'ad_id': raw_data['id'],
+            'platform': 'test',
+            'headline': raw_data['title'],
+            'body_text': '',
+            'brand_name': 'Test Brand',
+            'media_urls': []
+        }
+
+
+def test_streaming_pipeline_runs_all_stages():
+    """Test every collected ad is preprocessed and classified"""
+    config = CollectionConfig(platform='test', keywords=['test'], max_results=10)
+    pipeline = StreamingPipeline(
+        PreprocessingPipeline(),
+        ClassificationPipeline(),
+        preprocess_workers=2
+    )
+
+    raw_ads, preprocessed_ads, classified_ads = pipeline.run(StreamingCollector(config))
+
+    assert len(raw_ads) == 5
+    assert len(preprocessed_ads) == 5
+    assert sorted(ad['ad_id'] for ad in classified_ads) == ['0', '1', '2', '3', '4']
@@ -28,11 +28,31 @@ def test_preprocessing_single_ad():
     assert result['quality']['preprocessing_status'] == 'success'
 
 
+def test_preprocessing_batch():
+    """Test batch preprocessing keeps the input order"""
+    pipeline = PreprocessingPipeline()
+    
+    raw_ads = [
+        {
+            'ad_id': f'test_{i:03d}',
+            'platform': 'test',
+            'headline': f'  Headline   {i} ',
+            'brand_name': 'Test Brand Inc.',
+            'media_urls': []
+        }
+        for i in range(6)
+    ]
+    
+    results = pipeline.preprocess_batch(raw_ads, max_workers=2)
+    
+    assert [r['ad_id'] for r in results] == [ad['ad_id'] for ad in raw_ads]
+    assert all(r['quality']['preprocessing_status'] == 'success' for r in results)
+    assert [r['content']['headline'] for r in results] == [f'Headline {i}' for i in range(6)]
+
+
 def test_text_cleaning():
     """Test text cleaning utilities"""
-    from src.preprocessing.text_processing.cleaner import TextCleaner
-    
-    cleaner = TextCleaner()
+    from src.preprocessing.text_processing import cleaner
     
     # Test whitespace removal
     assert cleaner.remove_extra_whitespace('  test   text  ') == 'test text'
@@ -40,10 +60,36 @@ def test_text_cleaning():
     # Test HTML removal
     assert cleaner.remove_html_tags('<p>Hello</p>') == 'Hello'
     
+    # Test smart quote standardization
+    assert cleaner.standardize_quotes('\u201cIt\u2019s\u201d') == '"It\'s"'
+    
+    # Test encoding fixes, on both the ASCII fast path and via ftfy
+    assert cleaner.fix_encoding('plain text') == 'plain text'
+    assert cleaner.fix_encoding('Tom &amp; Jerry') == 'Tom & Jerry'
+    assert cleaner.fix_encoding('cafÃ©') == 'café'
+    
     # Test full clean
     dirty = '  <b>Test</b>   Text  '
     clean = cleaner.clean(dirty)
     assert clean == 'Test Text'
+    
+    # A '<' and a '>' on different lines are ad copy, not a tag
+    prices = 'Save 20% on orders < $50\nFree shipping on orders > $100'
+    assert cleaner.clean(prices) == 'Save 20% on orders < $50 Free shipping on orders > $100'
+    assert cleaner.remove_html_tags(prices) == prices
+
+
+def test_emoji_detection():
+    """Test emoji detection, including multi-code-point emojis"""
+    import emoji
+    from src.preprocessing.text_processing.cleaner import TextNormalizer
+    
+    text = 'Sale 🔥🔥 ends soon 👍🏽 family 👨\u200d👩\u200d👧 in the 🇺🇸 #️⃣1 café ❤️'
+    result = TextNormalizer.detect_emojis(text)
+    
+    assert result['emojis'] == [e['emoji'] for e in emoji.emoji_list(text)]
+    assert result['emoji_count'] == 7
+    assert TextNormalizer.detect_emojis('No emojis here #1')['contains_emojis'] is False
 
 
 def test_brand_normalization():
@@ -55,3 +101,40 @@ def test_brand_normalization():
     assert normalizer.normalize_brand_name('Test Corp.') == 'test'
     assert normalizer.normalize_brand_name('Test Inc.') == 'test'
     assert normalizer.normalize_brand_name('Test™') == 'test'
+
+
+def test_brand_normalization_ascii_kernel(monkeypatch):
+    """Test that the compiled ASCII path matches the regex path"""
+    from src.preprocessing.text_processing import _fast
+    from src.preprocessing.text_processing.cleaner import TextNormalizer
+    
+    brands = [
+        'The Coca-Cola Company, Inc. and Co-Branding Partners',
+        'ACME\tWidgets   Corp.   International   Holdings LLC',
+        'Inc Inc Inc Inc Inc Inc Inc Inc Inc',
+        'incorporated corporations company_co ltd. co',
+    ]
+    fast = [TextNormalizer.normalize_brand_name(brand) for brand in brands]
+    monkeypatch.setattr(_fast, 'NUMBA_AVAILABLE', False)
+    assert fast == [TextNormalizer.normalize_brand_name(brand) for brand in brands]
+    assert fast[0] == 'thecocacolaandcobrandingpartners'
+
+
+def test_ocr_result_cache(monkeypatch):
+    """Test that successful OCR results are reused by image URL"""
+    from src.preprocessing.image_processing.ocr_engine import OCREngine
+    
+    engine = OCREngine()
+    downloads = []
+    monkeypatch.setattr(engine, '_load_image', lambda url: downloads.append(url) or url)
+    monkeypatch.setattr(
+        engine, '_extract_from_image',
+        lambda image, url: {'text': url, 'confidence': 0.9, 'success': 'broken' not in url}
+    )
+    
+    for url in ['https://cdn/a.png', 'https://cdn/a.png', 'https://cdn/broken.png', 'https://cdn/broken.png']:
+        engine.extract_text(url)
+    
+    # Failures are not cached, so the broken image is downloaded again
+    assert downloads == ['https://cdn/a.png', 'https://cdn/broken.png', 'https://cdn/broken.png']
+    assert engine.extract_text('https://cdn/a.png')['text'] == 'https://cdn/a.png'